@@ -1,11 +1,12 @@
 import typer
 import logging
-from common.logging import setup_logging
 
 app = typer.Typer()
 
 
 newsletter_app = typer.Typer()
+# Heavy dependencies (newsletter, writer, common.audio -> torch/transformers)
+# are imported inside the command bodies, so `--help` only loads typer.
 app.add_typer(newsletter_app, name="newsletter", help="Newsletter tools")
 
 
@@ -22,6 +23,9 @@ def callback():
     """
     My Tools CLI - Aggregator for all tools.
     """
+    # Runs on command dispatch, not at import or for --help
+    from common.logging import setup_logging
+
     setup_logging()
     logging.info("CLI initialized and ready to execute commands")
 
@@ -1,66 +1,417 @@
+import asyncio
+import contextlib
+import hashlib
+import io
 import os
 import re
+import subprocess
 import tempfile
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import torch
 from gtts import gTTS
 from transformers import pipeline
-from pydub import AudioSegment
 import numpy as np
 import soundfile as sf
 from tenacity import retry, stop_after_attempt, wait_fixed
-from .config import AUDIO_SPEED, DATA_DIR, AUDIO_LANG, TTS_RATE_LIMIT_RPM
+from .rate_limit import RateLimiter
+from .config import (
+    AUDIO_SPEED,
+    DATA_DIR,
+    AUDIO_LANG,
+    TTS_RATE_LIMIT_RPM,
+    TTS_MAX_WORKERS,
+    TTS_CACHE_MAX_ENTRIES,
+    PIPER_MODEL,
+)
 
 # Text chunk size for TTS processing
 TEXT_CHUNK_SIZE = 400
 
-
-# Singleton GTTS rate limiting
-last_tts_call = 0
+# Number of text chunks per forward pass of a Hugging Face TTS pipeline
+TTS_BATCH_SIZE = 8
 
 # Rate limiting
 tts_wait_time = 60 / TTS_RATE_LIMIT_RPM
 
+# Singleton GTTS rate limiting, shared by all worker threads
+tts_rate_limiter = RateLimiter(tts_wait_time)
+
+# Output directories already created by this process
+_DIR_CACHE: set[str] = set()
+
+
+def _ensure_dir(path):
+    """Create a directory once per process; later calls skip the makedirs syscalls."""
+    if not path or path in _DIR_CACHE:
+        return
+    os.makedirs(path, exist_ok=True)
+    _DIR_CACHE.add(path)
+
+
+def _atempo_filter(speed):
+    """Build an ffmpeg atempo filter chain; a single atempo stage only accepts 0.5-2.0."""
+    stages = []
+    while speed > 2.0:
+        stages.append(2.0)
+        speed /= 2.0
+    while speed < 0.5:
+        stages.append(0.5)
+        speed /= 0.5
+    stages.append(speed)
+    return ",".join(f"atempo={stage:g}" for stage in stages)
+
+
+def _encode_mp3(input_file, filename, speed=1.0):
+    """Encode an audio file to MP3 with ffmpeg, applying atempo when speed != 1.0."""
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", input_file]
+    if speed != 1.0:
+        cmd += ["-filter:a", _atempo_filter(speed)]
+    cmd += ["-f", "mp3", filename]
+    subprocess.check_call(cmd)
+
+
+def _apply_speed(audio_file, speed):
+    """Time-stretch an MP3 in place with ffmpeg's atempo filter (pitch preserved)."""
+    sped_file = audio_file + ".out"
+    _encode_mp3(audio_file, sped_file, speed)
+    os.replace(sped_file, audio_file)
+
 
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_fixed(tts_wait_time),
 )
-def generate_audio_chunk(text_chunk, temp_file):
-    """Generate audio for a text chunk."""
-    global last_tts_call
-    current_time = time.time()
-    time_since_last = current_time - last_tts_call
-    if time_since_last < tts_wait_time:
-        time.sleep(tts_wait_time - time_since_last)
-    tts = gTTS(text=text_chunk, lang=AUDIO_LANG, slow=False)
-    tts.save(temp_file)
+def synthesize_chunk(text_chunk, lang=AUDIO_LANG):
+    """Synthesize a text chunk with gTTS and return the MP3 bytes, kept in memory."""
+    tts_rate_limiter.wait()
+    buffer = io.BytesIO()
+    tts = gTTS(text=text_chunk, lang=lang, slow=False)
+    tts.write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+class SynthesisCache:
+    """gTTS MP3 bytes on disk, keyed by text and language, least recently used evicted first.
+
+    Speed isn't part of the key: it is applied after synthesis.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=TTS_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir or os.path.join(DATA_DIR, "tts_cache")
+        self.max_entries = max_entries
+
+    def _path(self, text, lang):
+        key = hashlib.sha256(f"{lang}|{text}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def get(self, text, lang):
+        path = self._path(text, lang)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def set(self, text, lang, data):
+        _ensure_dir(self.cache_dir)
+        # Write then rename so a concurrent reader never sees a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, self._path(text, lang))
+        self._evict()
+
+    def _evict(self):
+        entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".mp3")]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry.path)
+
+
+tts_cache = SynthesisCache()
+
+
+def synthesize_chunk_cached(text_chunk, lang=AUDIO_LANG):
+    """Return gTTS MP3 bytes for a text chunk, from the on-disk cache when possible."""
+    audio = tts_cache.get(text_chunk, lang)
+    if audio is not None:
+        return audio
+    audio = synthesize_chunk(text_chunk, lang)
+    if audio:
+        # A full disk or unwritable cache must not fail the synthesis itself
+        try:
+            tts_cache.set(text_chunk, lang, audio)
+        except OSError as e:
+            print(f"Could not cache TTS chunk: {e}")
+    return audio
+
+
+def generate_audio_chunk(text_chunk, temp_file, speed=AUDIO_SPEED, lang=AUDIO_LANG):
+    """Generate audio for a text chunk and save it to temp_file.
+
+    The config values are bound as defaults so the per-chunk hot path reads
+    locals rather than module globals.
+    """
+    with open(temp_file, "wb") as f:
+        f.write(synthesize_chunk_cached(text_chunk, lang))
 
     # Apply speed adjustment if needed
-    if AUDIO_SPEED != 1.0:
-        audio = AudioSegment.from_mp3(temp_file)
+    if speed != 1.0:
         # Speed up the audio (higher speed = shorter duration)
-        sped_up_audio = audio.speedup(playback_speed=AUDIO_SPEED)
-        sped_up_audio.export(temp_file, format="mp3")
+        _apply_speed(temp_file, speed)
+
+
+def _get_model_dtype(device):
+    """Half precision on GPU (bf16 where supported), full precision on CPU."""
+    if device == "cuda":
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.float32
+
+
+@lru_cache(maxsize=4)
+def _get_synthesizer(tts_provider, device):
+    """Load a Hugging Face TTS pipeline once per (model, device) and reuse it."""
+    return pipeline(
+        "text-to-speech",
+        tts_provider,
+        device=device,
+        torch_dtype=_get_model_dtype(device),
+    )
+
+
+@lru_cache(maxsize=2)
+def _get_speaker_embedding(device):
+    """Default speaker embedding (zeros) - adjust size if needed for different models."""
+    return torch.zeros(1, 512).to(device=device, dtype=_get_model_dtype(device))
+
+
+def _inference_context(device):
+    """Autocast to the model dtype on GPU for modules that ignore torch_dtype."""
+    if device == "cuda":
+        return torch.autocast(device_type="cuda", dtype=_get_model_dtype(device))
+    return contextlib.nullcontext()
+
+
+def _mp3_pipe_command(output, speed=1.0, copy=True):
+    """ffmpeg command reading an MP3 stream on stdin and writing output.
+
+    Frames are copied without re-encoding at normal speed when copy is set;
+    otherwise the stream is re-encoded, with atempo applied if speed != 1.0.
+    """
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0"]
+    if speed != 1.0:
+        cmd += ["-filter:a", _atempo_filter(speed)]
+    elif copy:
+        cmd += ["-c", "copy"]
+    cmd += ["-f", "mp3", output]
+    return cmd
+
+
+def _pipe_to_ffmpeg(cmd, chunks, keep=None):
+    """Pipe byte chunks into an ffmpeg command and return its exit code.
+
+    Every chunk is consumed (and appended to keep, if given) even if ffmpeg
+    exits early, so a caller can retry with the full input.
+    """
+    with subprocess.Popen(cmd, stdin=subprocess.PIPE) as proc:
+        alive = True
+        try:
+            for chunk in chunks:
+                if keep is not None:
+                    keep.append(chunk)
+                if alive:
+                    try:
+                        proc.stdin.write(chunk)
+                    except BrokenPipeError:
+                        # ffmpeg gave up; its exit code says why
+                        alive = False
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            with contextlib.suppress(BrokenPipeError):
+                proc.stdin.close()
+    return proc.returncode
+
+
+def _write_mp3(mp3_chunks, filename, speed=1.0):
+    """Stream MP3 chunks to a file through a single ffmpeg pipe.
+
+    MP3 is a plain frame stream, so chunks from the same encoder can be joined
+    byte for byte. Frames are copied without re-encoding at normal speed;
+    otherwise the atempo filter is applied to the joined stream in the same pass.
+    mp3_chunks may be a lazy iterable: each chunk is piped as soon as it is
+    produced, so ffmpeg works on earlier chunks while later ones are still
+    being synthesized. Output goes to a temporary file first so a failure
+    part-way never leaves a truncated file that later runs would skip.
+    """
+    temp_file = filename + ".part"
+    copy = speed == 1.0
+    # Kept only for the copy fallback below
+    kept = [] if copy else None
+    try:
+        cmd = _mp3_pipe_command(temp_file, speed)
+        returncode = _pipe_to_ffmpeg(cmd, mp3_chunks, kept)
+        if returncode and copy:
+            # Stream copy fails if chunks disagree on encoder parameters;
+            # re-encoding the joined stream always works
+            print("Copying MP3 frames failed, re-encoding instead")
+            cmd = _mp3_pipe_command(temp_file, speed, copy=False)
+            returncode = _pipe_to_ffmpeg(cmd, kept)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        os.replace(temp_file, filename)
+    finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
+
+
+# libsndfile only encodes MP3 from 1.1.0 on
+_SNDFILE_MP3 = "MP3" in sf.available_formats()
+
+
+def write_samples_mp3(filename, samples, sampling_rate):
+    """Encode mono float samples to an MP3 file.
+
+    libsndfile encodes them in-process when it supports MP3; older builds
+    fall back to piping the raw samples through ffmpeg.
+    """
+    if _SNDFILE_MP3:
+        sf.write(filename, samples, sampling_rate, format="MP3")
+        return
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-f", "f32le"]
+    cmd += ["-ar", str(sampling_rate), "-ac", "1", "-i", "pipe:0", "-f", "mp3", filename]
+    try:
+        returncode = _pipe_to_ffmpeg(cmd, [np.asarray(samples, dtype="<f4").tobytes()])
+    except FileNotFoundError:
+        raise RuntimeError(
+            f"MP3 output needs libsndfile 1.1.0+ (found {sf.__libsndfile_version__}) "
+            "or ffmpeg on PATH"
+        ) from None
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _pack_words(text, max_chunk_length):
+    """Greedily pack words into chunks shorter than max_chunk_length characters."""
+    chunks = []
+    current_chunk = []
+    # Length of " ".join(current_chunk), tracked incrementally
+    current_length = 0
 
-    last_tts_call = time.time()
+    for word in text.split():
+        if current_chunk and current_length + len(word) >= max_chunk_length:
+            chunks.append(" ".join(current_chunk))
+            current_chunk = []
+            current_length = 0
+        if current_chunk:
+            current_length += 1
+        current_chunk.append(word)
+        current_length += len(word)
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    return chunks
+
+
+# Whitespace that follows sentence-ending punctuation
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _pack_sentences(text, max_chunk_length):
+    """Greedily pack whole sentences into chunks shorter than max_chunk_length.
+
+    Cutting only between sentences avoids audible breaks mid-sentence and keeps
+    earlier chunks unchanged when later text is edited. A single sentence that
+    is too long on its own is split between words instead.
+    """
+    chunks = []
+    current_chunk = []
+    # Length of " ".join(current_chunk), tracked incrementally
+    current_length = 0
+
+    for sentence in _SENTENCE_BREAK_RE.split(text.strip()):
+        if not sentence:
+            continue
+        if len(sentence) >= max_chunk_length:
+            if current_chunk:
+                chunks.append(" ".join(current_chunk))
+                current_chunk = []
+                current_length = 0
+            chunks.extend(_pack_words(sentence, max_chunk_length))
+            continue
+        if current_chunk and current_length + 1 + len(sentence) >= max_chunk_length:
+            chunks.append(" ".join(current_chunk))
+            current_chunk = []
+            current_length = 0
+        if current_chunk:
+            current_length += 1
+        current_chunk.append(sentence)
+        current_length += len(sentence)
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    return chunks
+
+
+def _strip_markdown(match):
+    """Return the spoken replacement for a single markdown construct."""
+    text_group, nested = _MARKDOWN_GROUPS[match.lastgroup]
+    if text_group is None:
+        return ""
+    text = match.group(text_group)
+    if nested:
+        # Links and emphasis can nest (e.g. **[title](url)**), so clean the inner text too
+        return _MARKDOWN_RE.sub(_strip_markdown, text)
+    return text
+
+
+# All markdown constructs handled in a single left-to-right scan. Alternatives are
+# tried in order, so code is matched before the emphasis patterns that could
+# otherwise eat into it. Unlike the old chain of substitutions, which stripped
+# emphasis first, underscores inside a code span are kept (`my_var` stays
+# my_var rather than becoming myvar).
+_MARKDOWN_RE = re.compile(
+    r"(?P<codeblock>(?s:```.*?```))"
+    r"|(?P<code>`(?P<code_text>[^`]+)`)"
+    r"|(?P<link>\[(?P<link_text>[^\]]+)\]\([^\)]+\))"
+    r"|(?P<url>https?://[^\s)\]]+)"
+    r"|(?P<header>^#{1,6}\s+)"
+    r"|(?P<quote>^>\s?)"
+    r"|(?P<bold>\*\*(?P<bold_text>.*?)\*\*)"
+    r"|(?P<italic>\*(?P<italic_text>.*?)\*)"
+    r"|(?P<underscore>_(?P<underscore_text>.*?)_)",
+    re.MULTILINE,
+)
+# Match group -> (group holding the text to keep or None to drop it, whether
+# that text may contain further markdown)
+_MARKDOWN_GROUPS = {
+    "codeblock": (None, False),
+    "code": ("code_text", False),
+    "link": ("link_text", True),
+    "url": (None, False),
+    "header": (None, False),
+    "quote": (None, False),
+    "bold": ("bold_text", True),
+    "italic": ("italic_text", True),
+    "underscore": ("underscore_text", True),
+}
+_BLANK_LINES_RE = re.compile(r"\n\n+")
+# Unpaired emphasis/code markers left over after the scan are never spoken
+_STRIP_TABLE = str.maketrans("", "", "*`")
 
 
 def clean_text_for_audio(text):
     """Clean text to make it suitable for audio generation."""
-    # Remove markdown links but keep the text
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-    # Remove markdown headers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Remove markdown bold/italic
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.*?)\*", r"\1", text)
-    text = re.sub(r"_(.*?)_", r"\1", text)
-    # Remove code blocks
-    text = re.sub(r"```.*?```", "", text, flags=re.DOTALL)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
+    # Remove links, URLs, headers, bold/italic and code in one pass
+    text = _MARKDOWN_RE.sub(_strip_markdown, text).translate(_STRIP_TABLE)
     # Clean up extra whitespace
-    text = re.sub(r"\n\n+", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
     text = text.strip()
     return text
 
@@ -75,38 +426,40 @@ def generate_audio(text, filename, tts_provider="gtts"):
         print("Using TTS provider: gTTS (Google Text-to-Speech API)")
         # Split into chunks of ~5000 characters (roughly 500-1000 words) for API calls
         max_chunk_length = 5000
-        words = text.split()
-        chunks = []
-        current_chunk = []
-
-        for word in words:
-            if len(" ".join(current_chunk)) + len(word) < max_chunk_length:
-                current_chunk.append(word)
-            else:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        audio_files = []
-        for i, chunk in enumerate(chunks):
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-                generate_audio_chunk(chunk, temp_file.name)
-                audio_files.append(temp_file.name)
-
-        # Combine all audio files
-        combined = AudioSegment.empty()
-        for audio_file in audio_files:
-            segment = AudioSegment.from_mp3(audio_file)
-            combined += segment
+        chunks = _pack_sentences(text, max_chunk_length)
 
-        # Export the combined audio
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        combined.export(filename, format="mp3")
+        # Requests are network-bound, so overlap them; the shared rate limiter
+        # still paces when each one starts. map() yields chunks in order as
+        # they finish, and each is piped straight into ffmpeg, so joining (and
+        # speeding up) earlier chunks overlaps synthesis of later ones. Most
+        # summaries fit in one chunk, which needs no worker threads at all.
+        _ensure_dir(os.path.dirname(filename))
+        if len(chunks) <= 1:
+            _write_mp3(
+                map(synthesize_chunk_cached, chunks), filename, speed=AUDIO_SPEED
+            )
+        else:
+            workers = min(TTS_MAX_WORKERS, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                audio_chunks = executor.map(synthesize_chunk_cached, chunks)
+                _write_mp3(audio_chunks, filename, speed=AUDIO_SPEED)
 
-        # Clean up temporary files
-        for audio_file in audio_files:
-            os.unlink(audio_file)
+    elif tts_provider == "piper":
+        print(f"Using TTS provider: Piper (local model {PIPER_MODEL})")
+        # Piper runs locally and streams the whole document, so no chunking or
+        # rate limiting is needed; ffmpeg then encodes (and speeds up) once.
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_wav:
+            temp_wav_path = temp_wav.name
+        try:
+            subprocess.run(
+                ["piper", "--model", PIPER_MODEL, "--output_file", temp_wav_path],
+                input=text.encode("utf-8"),
+                check=True,
+            )
+            _ensure_dir(os.path.dirname(filename))
+            _encode_mp3(temp_wav_path, filename, speed=AUDIO_SPEED)
+        finally:
+            os.unlink(temp_wav_path)
 
     else:
         print(f"Using TTS model: {tts_provider}")
@@ -144,32 +497,51 @@ def generate_audio(text, filename, tts_provider="gtts"):
 
         # Initialize pipeline
         try:
-            synthesizer = pipeline("text-to-speech", tts_provider, device=device)
+            synthesizer = _get_synthesizer(tts_provider, device)
             print(f"Using TTS model: {tts_provider} on device: {device}")
         except Exception as e:
             print(f"Error loading TTS model '{tts_provider}': {e}")
             return
 
-        # Use a default speaker embedding (zeros) - adjust size if needed for different models
-        speaker_embedding = torch.zeros(1, 512, dtype=torch.float32)
+        speaker_embedding = _get_speaker_embedding(device)
 
-        # Generate audio for each chunk
+        # Generate audio for all chunks in batched forward passes
+        chunks = [chunk for chunk in chunks if chunk.strip()]
+        forward_params = {"speaker_embeddings": speaker_embedding}
         audio_arrays = []
         sample_rates = []
 
-        for i, chunk in enumerate(chunks, 1):
-            if not chunk.strip():
-                continue
-            try:
-                print(f"Processing TTS chunk {i}/{len(chunks)} ({len(chunk)} chars)")
-                speech = synthesizer(
-                    chunk, forward_params={"speaker_embeddings": speaker_embedding}
+        try:
+            print(
+                f"Processing {len(chunks)} TTS chunks in batches of {TTS_BATCH_SIZE}"
+            )
+            with torch.inference_mode(), _inference_context(device):
+                speeches = synthesizer(
+                    chunks, batch_size=TTS_BATCH_SIZE, forward_params=forward_params
+                )
+            for speech in speeches:
+                # Flatten (1, samples) outputs so chunks of any length concatenate
+                audio_arrays.append(
+                    np.asarray(speech["audio"], dtype=np.float32).ravel()
                 )
-                audio_arrays.append(np.array(speech["audio"]))
                 sample_rates.append(speech["sampling_rate"])
-            except Exception as e:
-                print(f"Error generating audio for chunk {i}: {e}")
-                continue
+        except Exception as e:
+            # Fall back to one chunk at a time so a single bad chunk is skipped
+            print(f"Batched TTS failed ({e}), retrying chunk by chunk")
+            audio_arrays = []
+            sample_rates = []
+            for i, chunk in enumerate(chunks, 1):
+                try:
+                    print(f"Processing TTS chunk {i}/{len(chunks)} ({len(chunk)} chars)")
+                    with torch.inference_mode(), _inference_context(device):
+                        speech = synthesizer(chunk, forward_params=forward_params)
+                    audio_arrays.append(
+                        np.asarray(speech["audio"], dtype=np.float32).ravel()
+                    )
+                    sample_rates.append(speech["sampling_rate"])
+                except Exception as e:
+                    print(f"Error generating audio for chunk {i}: {e}")
+                    continue
 
         if not audio_arrays:
             print("Error: No audio generated.")
@@ -178,20 +550,23 @@ def generate_audio(text, filename, tts_provider="gtts"):
         # All chunks should have same sample rate
         target_rate = sample_rates[0] if sample_rates else 16000
 
-        # Concatenate all audio chunks
-        concatenated = np.concatenate(audio_arrays, axis=0)
-        audio_data = concatenated.squeeze()
+        # Concatenate all samples in a single copy
+        audio_data = np.concatenate(audio_arrays)
         sampling_rate = target_rate
 
         # Save audio
+        _ensure_dir(os.path.dirname(filename))
         ext = os.path.splitext(filename)[1].lower()
         if ext == ".wav":
             sf.write(filename, audio_data, sampling_rate)
         else:
-            # Default to mp3 via pydub
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            temp_wav = filename.rsplit(".", 1)[0] + "_temp.wav"
-            sf.write(temp_wav, audio_data, sampling_rate)
-            audio = AudioSegment.from_wav(temp_wav)
-            audio.export(filename, format="mp3")
-            os.remove(temp_wav)
+            # Default to mp3, encoded from the samples without a temp WAV
+            write_samples_mp3(filename, audio_data, sampling_rate)
+
+
+async def generate_audio_async(text, filename, tts_provider="gtts"):
+    """Async variant of generate_audio, run in a worker thread.
+
+    Concurrent calls share tts_rate_limiter, so gTTS pacing holds across them.
+    """
+    await asyncio.to_thread(generate_audio, text, filename, tts_provider)
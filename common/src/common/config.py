@@ -1,44 +1,76 @@
 import os
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
+from functools import cache
 
-load_dotenv()
+_DOTENV_LOADED = False
 
 
-# API Key from environment
-def get_google_api_key():
-    key = os.getenv("GOOGLE_API_KEY")
+def _ensure_dotenv():
+    """Load .env on the first key lookup rather than at import."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+def _require_env(name):
+    _ensure_dotenv()
+    key = os.getenv(name)
     if not key:
-        raise ValueError("GOOGLE_API_KEY environment variable not set")
+        raise ValueError(f"{name} environment variable not set")
     return key
 
 
+# API Key from environment. Found keys are cached; a missing key raises
+# again on every call, so setting it later in the process still works.
+@cache
+def get_google_api_key():
+    return _require_env("GOOGLE_API_KEY")
+
+
+@cache
 def get_groq_api_key():
-    key = os.getenv("GROQ_API_KEY")
-    if not key:
-        raise ValueError("GROQ_API_KEY environment variable not set")
-    return key
+    return _require_env("GROQ_API_KEY")
 
 
+@cache
 def get_openai_api_key():
-    key = os.getenv("OPENAI_API_KEY")
-    if not key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    return key
+    return _require_env("OPENAI_API_KEY")
 
 
+@cache
 def get_telegram_bot_token():
-    key = os.getenv("TELEGRAM_BOT_TOKEN")
-    if not key:
-        raise ValueError("TELEGRAM_BOT_TOKEN environment variable not set")
-    return key
+    return _require_env("TELEGRAM_BOT_TOKEN")
 
 
+@cache
 def get_telegram_chat_id():
-    key = os.getenv("TELEGRAM_CHAT_ID")
-    if not key:
-        raise ValueError("TELEGRAM_CHAT_ID environment variable not set")
-    return key
+    return _require_env("TELEGRAM_CHAT_ID")
+
+
+def _require_env_keys(name):
+    """Return the comma-separated keys in e.g. GOOGLE_API_KEYS, else the single key."""
+    _ensure_dotenv()
+    keys = [key.strip() for key in os.getenv(f"{name}S", "").split(",") if key.strip()]
+    return tuple(keys) or (_require_env(name),)
+
+
+# Several keys per provider multiply the effective rate limit (see LLMClient)
+@cache
+def get_google_api_keys():
+    return _require_env_keys("GOOGLE_API_KEY")
+
+
+@cache
+def get_groq_api_keys():
+    return _require_env_keys("GROQ_API_KEY")
+
+
+@cache
+def get_openai_api_keys():
+    return _require_env_keys("OPENAI_API_KEY")
 
 
 # LLM Provider settings
@@ -53,16 +85,38 @@ DATA_DIR = "data"
 # Rate limiting: requests per minute for LLM
 RATE_LIMIT_RPM = 0.5  # Conservative rate limiting to avoid quota issues
 
+# Articles packed into one classify-and-summarize LLM call
+LLM_BATCH_SIZE = 5
+
+# Batches in flight at once; per-key rate limiters still pace each request
+LLM_MAX_WORKERS = 4
+
 # Rate limiting: requests per minute for gTTS
 TTS_RATE_LIMIT_RPM = 1
 
-# Global for LLM rate limiting
-last_llm_call = 0
+# Maximum number of gTTS chunk requests in flight at once
+TTS_MAX_WORKERS = 4
+
+# Synthesized gTTS chunks kept on disk (under DATA_DIR/tts_cache) for reuse
+TTS_CACHE_MAX_ENTRIES = 512
+
+# LLM response cache: "file" (under DATA_DIR/llm_cache), "memory", "redis" or "none"
+LLM_CACHE_BACKEND = "file"
+LLM_CACHE_TTL = 86400  # Seconds a cached response stays valid
+LLM_CACHE_MAX_ENTRIES = 1024  # Only used by the memory backend
+
+# Near-duplicate lookup on top of the exact cache (needs sentence-transformers)
+LLM_CACHE_SEMANTIC = False
+LLM_CACHE_SEMANTIC_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+LLM_CACHE_SEMANTIC_THRESHOLD = 0.92  # Minimum cosine similarity for a hit
 
 # Audio settings
 AUDIO_LANG = "en"
 AUDIO_SPEED = 1.25  # Speed multiplier (1.0 = normal speed, 1.25 = 25% faster)
 
+# Voice model for the local Piper TTS provider (--tts piper)
+PIPER_MODEL = "en_US-lessac-medium.onnx"
+
 # Date format
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -75,6 +129,12 @@ def get_days_ago(days):
     return datetime.now() - timedelta(days=days)
 
 
+def get_date_strs(days_list):
+    """Return date strings for several days ago, reading the clock only once."""
+    now = datetime.now()
+    return [get_date_str(now - timedelta(days=days)) for days in days_list]
+
+
 def get_start_of_day(days_ago=0):
     date = datetime.now() - timedelta(days=days_ago)
     return date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -1,209 +1,645 @@
+import asyncio
+import atexit
+import json
+import logging
 import os
-import time
+import re
+import sys
+import threading
+import weakref
+from functools import lru_cache
+import httpx
+from langchain_core.prompts import PromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
-from tenacity import retry, stop_after_attempt, wait_fixed
+import groq
+import openai
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 from .config import (
-    get_google_api_key,
-    get_groq_api_key,
-    get_openai_api_key,
+    get_google_api_keys,
+    get_groq_api_keys,
+    get_openai_api_keys,
     RATE_LIMIT_RPM,
-    last_llm_call,
+    LLM_BATCH_SIZE,
     GROQ_MODEL,
     GEMINI_MODEL,
     OPENAI_MODEL,
 )
+from .llm_cache import create_cache, make_cache_key
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive connection pools shared by every provider client, so sequential
+# calls reuse one TCP+TLS session instead of handshaking each time
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+_shared_http_client = httpx.Client(
+    limits=_HTTP_LIMITS, http2=HTTP2_AVAILABLE, timeout=30
+)
+atexit.register(_shared_http_client.close)
 
 
 class LLMClient:
-    """Singleton LLM client"""
+    """Singleton LLM client, holding one model instance per configured API key"""
 
     _instance = None
-    _instances = {}
+    _instances = {}  # provider -> [(llm, rate limiter)], one per key
+    _rr_idx = {}  # provider -> round-robin position
+    _keys = {}  # provider -> API keys, in the order of _instances
+    # An AsyncClient's pool is bound to the event loop it first runs on, and
+    # the process calls asyncio.run many times, so async calls get their own
+    # client, and models built on it, per running loop
+    _loop_llms = weakref.WeakKeyDictionary()  # loop -> (AsyncClient, {(provider, i): llm})
+    _lock = threading.Lock()
 
     def __new__(cls):
+        # Double-checked so concurrent first calls still share one instance
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
-    def get_llm(self, provider="gemini"):
-        """Get cached LLM instance for the specified provider."""
+    def _create_llm(self, provider, api_key, async_client=None):
+        if provider == "groq":
+            return ChatGroq(
+                model=GROQ_MODEL,
+                api_key=api_key,
+                max_retries=0,
+                timeout=30,
+                http_client=_shared_http_client,
+                http_async_client=async_client,
+            )
+        elif provider == "gemini":
+            # Gemini goes through the google-genai SDK, which pools its
+            # own connections; retries are left to tenacity as for the others
+            return ChatGoogleGenerativeAI(
+                model=GEMINI_MODEL,
+                google_api_key=api_key,
+                max_retries=0,
+                timeout=30,
+            )
+        elif provider == "openai":
+            return ChatOpenAI(
+                model=OPENAI_MODEL,
+                openai_api_key=api_key,
+                max_retries=0,
+                timeout=30,
+                http_client=_shared_http_client,
+                http_async_client=async_client,
+            )
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    def _get_entries(self, provider):
+        """Create the (llm, limiter) pairs for a provider on first use."""
         if provider not in self._instances:
-            if provider == "groq":
-                self._instances[provider] = ChatGroq(
-                    model=GROQ_MODEL,
-                    api_key=get_groq_api_key(),
-                    max_retries=0,
-                    timeout=30,
-                )
-            elif provider == "gemini":
-                # Gemini doesn't support max_retries parameter in the same way
-                self._instances[provider] = ChatGoogleGenerativeAI(
-                    model=GEMINI_MODEL,
-                    google_api_key=get_google_api_key(),
-                    timeout=30,
+            key_getters = {
+                "groq": get_groq_api_keys,
+                "gemini": get_google_api_keys,
+                "openai": get_openai_api_keys,
+            }
+            if provider not in key_getters:
+                raise ValueError(f"Unsupported LLM provider: {provider}")
+            with self._lock:
+                if provider not in self._instances:
+                    # Each key has its own quota, hence its own limiter
+                    keys = key_getters[provider]()
+                    entries = [
+                        (self._create_llm(provider, key), RateLimiter(wait_time))
+                        for key in keys
+                    ]
+                    # Publish last: the unlocked check above must never see
+                    # a provider whose round-robin state isn't set up yet
+                    self._rr_idx[provider] = 0
+                    self._keys[provider] = keys
+                    self._instances[provider] = entries
+        return self._instances[provider]
+
+    def get_llm(self, provider="gemini"):
+        """Get cached LLM instance for the specified provider (the first key's)."""
+        return self._get_entries(provider)[0][0]
+
+    def _next_index(self, provider):
+        """Index of the key whose limiter frees up soonest, rotating on ties."""
+        entries = self._get_entries(provider)
+        with self._lock:
+            start = self._rr_idx[provider]
+            self._rr_idx[provider] = (start + 1) % len(entries)
+            order = list(range(start, len(entries))) + list(range(start))
+            return min(order, key=lambda i: entries[i][1].next_free)
+
+    def get_llm_round_robin(self, provider="gemini"):
+        """Return the next (llm, rate limiter) pair for the provider.
+
+        Picks the key whose limiter frees up soonest, rotating on ties, so
+        calls spread over all keys and the effective RPM scales with them.
+        """
+        return self._get_entries(provider)[self._next_index(provider)]
+
+    def get_async_llm_round_robin(self, provider="gemini"):
+        """Like get_llm_round_robin, with the LLM on the running loop's HTTP client."""
+        index = self._next_index(provider)
+        limiter = self._instances[provider][index][1]
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._loop_llms:
+                self._loop_llms[loop] = (
+                    httpx.AsyncClient(
+                        limits=_HTTP_LIMITS, http2=HTTP2_AVAILABLE, timeout=30
+                    ),
+                    {},
                 )
-            elif provider == "openai":
-                self._instances[provider] = ChatOpenAI(
-                    model=OPENAI_MODEL,
-                    openai_api_key=get_openai_api_key(),
-                    max_retries=0,
-                    timeout=30,
+            client, llms = self._loop_llms[loop]
+            if (provider, index) not in llms:
+                llms[(provider, index)] = self._create_llm(
+                    provider, self._keys[provider][index], client
                 )
-            else:
-                raise ValueError(f"Unsupported LLM provider: {provider}")
+            return llms[(provider, index)], limiter
 
-        return self._instances[provider]
+    async def aclose_loop_client(self):
+        """Close the running loop's HTTP client and drop the models built on it."""
+        with self._lock:
+            entry = self._loop_llms.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
 
 
 # Global instance
 llm_client = LLMClient()
 
-# Rate limiting
+# Content sent per article is capped in tokens (Gemini has token limits).
+# MAX_CONTENT_CHARS bounds how much text is read and tokenized at all; it is
+# also the cut used when no tokenizer is available (~4 chars per token).
+MAX_CONTENT_TOKENS = 2500
+MAX_CONTENT_CHARS = MAX_CONTENT_TOKENS * 8
+FALLBACK_CONTENT_CHARS = MAX_CONTENT_TOKENS * 4
+
+# Rate limiting per API key, shared by sync calls, worker threads and async tasks
 wait_time = 60 / RATE_LIMIT_RPM
 
+# Errors a retry can fix; anything else (bad key, unknown model, invalid
+# request) fails on the first attempt instead of after two more waits
+_TRANSIENT_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # Includes APITimeoutError
+    openai.InternalServerError,
+    groq.RateLimitError,
+    groq.APIConnectionError,
+    groq.InternalServerError,
+    httpx.TimeoutException,
+    httpx.TransportError,
+    TimeoutError,
+    ConnectionError,
+)
+_TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def _is_transient_error(e):
+    """Return True for rate limits, timeouts and server or connection failures."""
+    if isinstance(e, _TRANSIENT_ERRORS):
+        return True
+    status = getattr(e, "status_code", None) or getattr(e, "code", None)
+    if status in _TRANSIENT_STATUS_CODES:
+        return True
+    # Gemini errors can arrive wrapped by LangChain with only the message left
+    message = str(e)
+    return "ResourceExhausted" in message or "RESOURCE_EXHAUSTED" in message
+
+
+# Exponential backoff from the rate-limit interval, re-raising the last error
+_llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=wait_time, max=4 * wait_time),
+    retry=retry_if_exception(_is_transient_error),
+    reraise=True,
+)
+
+
+# Response cache shared by both entry points (None when disabled)
+llm_cache = create_cache()
+
+_PROVIDER_MODELS = {"groq": GROQ_MODEL, "gemini": GEMINI_MODEL, "openai": OPENAI_MODEL}
+
+CLASSIFY_TEMPLATE = "First, determine if the following article is primarily about software engineering, AI, DevOps, security, or networking. Technical topics include: system design, architecture, programming, algorithms, data structures, development tools, frameworks, databases, APIs, DevOps, cloud infrastructure, AI/ML, cybersecurity, network architecture, and technical implementation details.\n\nTitle: {title}\n\nContent: {content}\n\nIf it's NOT related to these technical areas (e.g., business, product, HR, marketing, research papers, etc.), respond with only: SKIP\n\nIf it IS related, provide a response in the following format:\n\nCATEGORIES: [list 2-4 relevant categories/tags, separated by commas]\n\nSUMMARY: [provide a deeper summary in 3-5 sentences addressing key questions like what the article is about, why it matters, and how it works or what it achieves]"
+
+SUMMARIZE_TEMPLATE = "Provide a deeper summary of the following article in 3-5 sentences, addressing key questions like what the article is about, why it matters, and how it works or what it achieves:\n\nTitle: {title}\n\nContent: {content}\n\nSummary:"
+
+BATCH_CLASSIFY_TEMPLATE = "For each article below, determine if it is primarily about software engineering, AI, DevOps, security, or networking. Technical topics include: system design, architecture, programming, algorithms, data structures, development tools, frameworks, databases, APIs, DevOps, cloud infrastructure, AI/ML, cybersecurity, network architecture, and technical implementation details. Articles NOT related to these technical areas (e.g., business, product, HR, marketing, research papers, etc.) are skipped.\n\nRespond with exactly one JSON object per line, one line per article, and nothing else:\n{{\"id\": <article number>, \"skip\": <true or false>, \"categories\": [2-4 relevant categories/tags], \"summary\": \"<deeper summary in 3-5 sentences addressing what the article is about, why it matters, and how it works or what it achieves>\"}}\n\nFor skipped articles, categories and summary may be empty.\n\nArticles:\n\n{articles}"
+
+# Parsed once at import instead of on every request
+_CLASSIFY_PROMPT = PromptTemplate.from_template(CLASSIFY_TEMPLATE)
+_SUMMARIZE_PROMPT = PromptTemplate.from_template(SUMMARIZE_TEMPLATE)
+_BATCH_CLASSIFY_PROMPT = PromptTemplate.from_template(BATCH_CLASSIFY_TEMPLATE)
+
+# Categories and summary of a classify response, in one scan
+_RESPONSE_RE = re.compile(r"CATEGORIES:\s*(.*?)\s*SUMMARY:\s*(.*)", re.DOTALL)
+
+# Removed from both ends of each category tag
+_CATEGORY_STRIP_CHARS = " \t\r\n[]"
+
 
 def get_llm(provider="gemini"):
     """Get LLM instance for the specified provider."""
     return llm_client.get_llm(provider)
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_fixed(wait_time),
-)
-def classify_and_summarize_article(article, provider="gemini"):
-    """Classify if an article is software engineering related and summarize if it is."""
-    global last_llm_call
-    current_time = time.time()
-    time_since_last = current_time - last_llm_call
-    if time_since_last < wait_time:
-        time.sleep(wait_time - time_since_last)
+def acquire_llm(provider="gemini"):
+    """Wait for a rate-limit slot on the next API key and return its LLM."""
+    llm, limiter = llm_client.get_llm_round_robin(provider)
+    limiter.wait()
+    return llm
+
+
+async def aacquire_llm(provider="gemini"):
+    """Async variant of acquire_llm that doesn't block the event loop."""
+    llm, limiter = llm_client.get_async_llm_round_robin(provider)
+    await limiter.wait_async()
+    return llm
+
 
+@lru_cache(maxsize=1)
+def _get_token_encoding():
+    """Load the tiktoken encoding once, or None if it can't be loaded.
+
+    The encoding file is downloaded on first use, so this fails offline.
+    """
     try:
-        llm = get_llm(provider)
-        from langchain_core.prompts import PromptTemplate
-
-        # Get content
-        content = ""
-        content_path = article.get("content_path")
-        if content_path and os.path.exists(content_path):
-            with open(content_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("Token counting unavailable, truncating by characters: %s", e)
+        return None
+
+
+def _truncate_content(content):
+    """Cap content at MAX_CONTENT_TOKENS, marking the cut with an ellipsis."""
+    content = content[:MAX_CONTENT_CHARS]
+    encoding = _get_token_encoding()
+    if encoding is None:
+        if len(content) > FALLBACK_CONTENT_CHARS:
+            return content[:FALLBACK_CONTENT_CHARS] + "..."
+        return content
+    tokens = encoding.encode(content, disallowed_special=())
+    if len(tokens) > MAX_CONTENT_TOKENS:
+        return encoding.decode(tokens[:MAX_CONTENT_TOKENS]) + "..."
+    return content
+
+
+@lru_cache(maxsize=256)
+def _read_content(path, mtime):
+    """Read a content file once per (path, mtime), so retries and repeat calls skip the I/O.
+
+    Only the first 4 bytes per allowed character are read (the UTF-8 maximum),
+    so a multi-megabyte page is never read, decoded or tokenized past the limit.
+    """
+    with open(path, "rb") as f:
+        data = f.read(MAX_CONTENT_CHARS * 4 + 1)
+    return _truncate_content(data.decode("utf-8", errors="replace"))
+
+
+def _read_article_content(article):
+    """Return the article's stored content, falling back to its RSS content or summary."""
+    content_path = article.get("content_path")
+    if content_path:
+        try:
+            mtime = os.path.getmtime(content_path)
+        except OSError:
+            pass  # No stored file; use the RSS content instead
         else:
-            content = article.get("content", article.get("summary", ""))
+            return _read_content(content_path, mtime)
+    return _truncate_content(article.get("content", article.get("summary", "")))
+
 
-        # Log request details for debugging
-        print(f"LLM Request - Provider: {provider}, Title: {article['title'][:50]}..., Content length: {len(content)}")
+def _cache_lookup(provider, template, article, content):
+    """Return (cache entry or None, cache key, semantic token) for an LLM request."""
+    if llm_cache is None:
+        return None, None, None
+    key = make_cache_key(
+        provider, _PROVIDER_MODELS.get(provider), template, article["title"], content
+    )
+    entry, token = llm_cache.get(key, f"{article['title']}\n{content[:1000]}")
+    return entry, key, token
 
-        # Truncate content if too long (Gemini has token limits)
-        if len(content) > 10000:  # Conservative limit
-            content = content[:10000] + "..."
-            print(f"Content truncated to 10000 chars for API limits")
 
-        prompt = PromptTemplate.from_template(
-            "First, determine if the following article is primarily about software engineering, AI, DevOps, security, or networking. Technical topics include: system design, architecture, programming, algorithms, data structures, development tools, frameworks, databases, APIs, DevOps, cloud infrastructure, AI/ML, cybersecurity, network architecture, and technical implementation details.\n\nTitle: {title}\n\nContent: {content}\n\nIf it's NOT related to these technical areas (e.g., business, product, HR, marketing, research papers, etc.), respond with only: SKIP\n\nIf it IS related, provide a response in the following format:\n\nCATEGORIES: [list 2-4 relevant categories/tags, separated by commas]\n\nSUMMARY: [provide a deeper summary in 3-5 sentences addressing key questions like what the article is about, why it matters, and how it works or what it achieves]"
-        )
-        chain = prompt | llm
+def cached_invoke(provider, template, title, content, invoke):
+    """Return invoke()'s response to a prompt built outside this module, via the cache.
+
+    template, title and content identify the prompt (the semantic tier
+    matches near-duplicates on title and content); invoke runs on a miss.
+    """
+    cached, cache_key, cache_token = _cache_lookup(
+        provider, template, {"title": title}, content
+    )
+    if cached is not None:
+        logger.info("LLM cache hit: %.50s...", title)
+        return cached["result"]
+    result = invoke()
+    if cache_key is not None:
+        llm_cache.set(cache_key, result, cache_token)
+    return result
+
+
+def _clean_categories(raw_categories):
+    """Strip whitespace and brackets in one pass and intern the tags.
+
+    The same few tags repeat across every article, so interning lets
+    downstream dict and set lookups hit the identity fast path.
+    """
+    categories = []
+    for cat in raw_categories:
+        cat = cat.strip(_CATEGORY_STRIP_CHARS)
+        if cat:
+            categories.append(sys.intern(cat))
+    return categories
+
+
+def _parse_classification(result):
+    """Parse a classify response into {"summary", "categories"}, or None for SKIP."""
+    if result.upper() == "SKIP":
+        logger.info("Article classified as non-technical, skipping")
+        return None  # Not tech-related
+
+    # Parse the response to extract categories and summary
+    try:
+        match = _RESPONSE_RE.search(result)
+        if match:
+            categories_part = match.group(1)
+            summary_part = match.group(2).strip()
+
+            # Clean up categories (remove brackets if present and split by comma)
+            categories = _clean_categories(categories_part.split(","))
+
+            logger.debug("Successfully parsed categories: %s", categories)
+            return {
+                "summary": summary_part,
+                "categories": categories
+            }
+        else:
+            # Fallback: treat the entire response as summary with empty categories
+            logger.warning("Response format unexpected, using fallback parsing")
+            return {
+                "summary": result,
+                "categories": []
+            }
+    except Exception as e:
+        logger.warning("Error parsing LLM response: %s", e)
+        # If parsing fails, return the entire result as summary
+        return {
+            "summary": result,
+            "categories": []
+        }
+
 
-        print(f"Sending request to {provider} API...")
+def _log_request(article, provider, content):
+    """Log request details for debugging."""
+    logger.debug(
+        "LLM Request - Provider: %s, Title: %.50s..., Content length: %d",
+        provider,
+        article["title"],
+        len(content),
+    )
+
+
+def _report_llm_error(article, e):
+    """Print an LLM API error with a hint for the common failure types."""
+    logger.error(
+        "LLM API Error for article '%s': %s: %s",
+        article.get("title", "Unknown"),
+        type(e).__name__,
+        e,
+    )
+
+    # Check for specific API errors
+    if "ResourceExhausted" in str(e):
+        logger.error("API quota exceeded or rate limited. Check your API key quota and billing.")
+        logger.error("Try switching to a different provider: --provider groq or --provider openai")
+    elif "InvalidArgument" in str(e):
+        logger.error("Invalid request. Content might be too long or malformed.")
+    elif "PermissionDenied" in str(e):
+        logger.error("API key invalid or insufficient permissions.")
+    elif "NotFound" in str(e):
+        logger.error("Model not found. Check model configuration.")
+
+
+@_llm_retry
+def classify_and_summarize_article(article, provider="gemini"):
+    """Classify if an article is software engineering related and summarize if it is."""
+    # Identical (or near-duplicate) articles reuse an earlier response
+    content = _read_article_content(article)
+    cached, cache_key, cache_token = _cache_lookup(
+        provider, CLASSIFY_TEMPLATE, article, content
+    )
+    if cached is not None:
+        logger.info("LLM cache hit: %.50s...", article["title"])
+        return cached["result"]
+
+    try:
+        llm = acquire_llm(provider)
+        _log_request(article, provider, content)
+        chain = _CLASSIFY_PROMPT | llm
+
+        logger.debug("Sending request to %s API...", provider)
         response = chain.invoke(
             {
                 "title": article["title"],
                 "content": content,
             }
         )
-        last_llm_call = time.time()
         result = response.content.strip()
 
-        print(f"LLM Response received, length: {len(result)}")
+        logger.debug("LLM Response received, length: %d", len(result))
 
-        if result.upper() == "SKIP":
-            print("Article classified as non-technical, skipping")
-            return None  # Not tech-related
+        parsed = _parse_classification(result)
+        if cache_key is not None:
+            llm_cache.set(cache_key, parsed, cache_token)
+        return parsed
 
-        # Parse the response to extract categories and summary
-        try:
-            if "CATEGORIES:" in result and "SUMMARY:" in result:
-                categories_part = result.split("CATEGORIES:")[1].split("SUMMARY:")[0].strip()
-                summary_part = result.split("SUMMARY:")[1].strip()
-
-                # Clean up categories (remove brackets if present and split by comma)
-                categories = [cat.strip().strip('[]') for cat in categories_part.split(',') if cat.strip()]
-
-                print(f"Successfully parsed categories: {categories}")
-                return {
-                    "summary": summary_part,
-                    "categories": categories
-                }
-            else:
-                # Fallback: treat the entire response as summary with empty categories
-                print("Response format unexpected, using fallback parsing")
-                return {
-                    "summary": result,
-                    "categories": []
-                }
-        except Exception as e:
-            print(f"Error parsing LLM response: {e}")
-            # If parsing fails, return the entire result as summary
-            return {
-                "summary": result,
-                "categories": []
+    except Exception as e:
+        _report_llm_error(article, e)
+        # Re-raise to trigger retry logic
+        raise
+
+
+@_llm_retry
+async def aclassify_and_summarize_article(article, provider="gemini"):
+    """Async variant of classify_and_summarize_article using chain.ainvoke.
+
+    Concurrent calls wait on the per-key rate limiters instead of blocking
+    the event loop, so several articles can be in flight within the RPM budget.
+    """
+    content = _read_article_content(article)
+    cached, cache_key, cache_token = _cache_lookup(
+        provider, CLASSIFY_TEMPLATE, article, content
+    )
+    if cached is not None:
+        logger.info("LLM cache hit: %.50s...", article["title"])
+        return cached["result"]
+
+    try:
+        llm = await aacquire_llm(provider)
+        _log_request(article, provider, content)
+        chain = _CLASSIFY_PROMPT | llm
+
+        logger.debug("Sending request to %s API...", provider)
+        response = await chain.ainvoke(
+            {
+                "title": article["title"],
+                "content": content,
             }
+        )
+        result = response.content.strip()
 
-    except Exception as e:
-        print(f"LLM API Error for article '{article.get('title', 'Unknown')}': {type(e).__name__}: {e}")
-
-        # Check for specific API errors
-        if "ResourceExhausted" in str(e):
-            print("ERROR: API quota exceeded or rate limited. Check your API key quota and billing.")
-            print("Try switching to a different provider: --provider groq or --provider openai")
-        elif "InvalidArgument" in str(e):
-            print("ERROR: Invalid request. Content might be too long or malformed.")
-        elif "PermissionDenied" in str(e):
-            print("ERROR: API key invalid or insufficient permissions.")
-        elif "NotFound" in str(e):
-            print("ERROR: Model not found. Check model configuration.")
+        logger.debug("LLM Response received, length: %d", len(result))
+
+        parsed = _parse_classification(result)
+        if cache_key is not None:
+            llm_cache.set(cache_key, parsed, cache_token)
+        return parsed
 
+    except Exception as e:
+        _report_llm_error(article, e)
         # Re-raise to trigger retry logic
         raise
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_fixed(wait_time),
-)
-def summarize_article(article, provider="gemini"):
-    """Summarize a single article."""
-    global last_llm_call
-    current_time = time.time()
-    time_since_last = current_time - last_llm_call
-    if time_since_last < wait_time:
-        time.sleep(wait_time - time_since_last)
+async def aclassify_and_summarize_articles(articles, provider="gemini"):
+    """Classify and summarize articles concurrently, paced by the shared rate limiter."""
+    try:
+        return await asyncio.gather(
+            *(aclassify_and_summarize_article(article, provider) for article in articles)
+        )
+    finally:
+        # The loop's client can't be reused once asyncio.run returns
+        await llm_client.aclose_loop_client()
 
-    llm = get_llm(provider)
-    from langchain_core.prompts import PromptTemplate
 
-    # Get content
-    content = ""
-    content_path = article.get("content_path")
-    if content_path and os.path.exists(content_path):
-        with open(content_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    else:
-        # Check for content field first, then fall back to summary
-        content = article.get("content", article.get("summary", ""))
-
-    prompt = PromptTemplate.from_template(
-        "Provide a deeper summary of the following article in 3-5 sentences, addressing key questions like what the article is about, why it matters, and how it works or what it achieves:\n\nTitle: {title}\n\nContent: {content}\n\nSummary:"
+@_llm_retry
+def summarize_article(article, provider="gemini"):
+    """Summarize a single article."""
+    content = _read_article_content(article)
+    cached, cache_key, cache_token = _cache_lookup(
+        provider, SUMMARIZE_TEMPLATE, article, content
     )
-    chain = prompt | llm
+    if cached is not None:
+        logger.info("LLM cache hit: %.50s...", article["title"])
+        return cached["result"]
+
+    llm = acquire_llm(provider)
+    chain = _SUMMARIZE_PROMPT | llm
     response = chain.invoke(
         {
             "title": article["title"],
             "content": content,
         }
     )
-    last_llm_call = time.time()
+    summary = response.content.strip()
+    if cache_key is not None:
+        llm_cache.set(cache_key, summary, cache_token)
+    return summary
+
+
+def _parse_batch_response(result, count):
+    """Parse a JSON-lines batch response into {article index: result or None}.
+
+    Articles missing from the response are left out; invalid JSON raises.
+    """
+    parsed = {}
+    for line in result.splitlines():
+        line = line.strip().rstrip(",")
+        if not line.startswith("{"):
+            continue  # Tolerate code fences or stray prose around the lines
+        item = json.loads(line)
+        index = int(item["id"]) - 1
+        if not 0 <= index < count:
+            continue
+        if item.get("skip"):
+            parsed[index] = None
+        else:
+            parsed[index] = {
+                "summary": str(item.get("summary", "")).strip(),
+                "categories": _clean_categories(
+                    str(cat) for cat in item.get("categories") or []
+                ),
+            }
+    return parsed
+
+
+@_llm_retry
+def _invoke_classify_batch(articles_text, provider):
+    """Send one batched classify request, honouring the shared rate limit."""
+    llm = acquire_llm(provider)
+    chain = _BATCH_CLASSIFY_PROMPT | llm
+    response = chain.invoke({"articles": articles_text})
     return response.content.strip()
+
+
+def classify_and_summarize_articles_batch(
+    articles, provider="gemini", batch_size=LLM_BATCH_SIZE
+):
+    """Classify and summarize articles, packing several into each LLM call.
+
+    Returns one result per article, in order, shaped like the result of
+    classify_and_summarize_article (None for non-technical articles). Articles
+    a batch response doesn't cover fall back to the single-article call.
+    """
+    results = [None] * len(articles)
+
+    # Cached articles need no request at all
+    pending = []
+    for i, article in enumerate(articles):
+        content = _read_article_content(article)
+        cached, cache_key, cache_token = _cache_lookup(
+            provider, CLASSIFY_TEMPLATE, article, content
+        )
+        if cached is not None:
+            results[i] = cached["result"]
+        else:
+            pending.append((i, article, content, cache_key, cache_token))
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+
+        # Content is already capped at MAX_CONTENT_TOKENS per article, as for
+        # the single-article call, so batching doesn't shorten what the model sees
+        articles_text = "\n\n".join(
+            f"[{n}] Title: {article['title']}\nContent: {content}"
+            for n, (_, article, content, _, _) in enumerate(batch, 1)
+        )
+
+        logger.info("Sending batch of %d articles to %s API...", len(batch), provider)
+        try:
+            parsed = _parse_batch_response(
+                _invoke_classify_batch(articles_text, provider), len(batch)
+            )
+        except Exception as e:
+            logger.warning(
+                "Batch request failed, falling back to single-article calls: %s: %s",
+                type(e).__name__,
+                e,
+            )
+            parsed = {}
+
+        for n, (i, article, _, cache_key, cache_token) in enumerate(batch):
+            if n not in parsed:
+                results[i] = classify_and_summarize_article(article, provider)
+                continue
+            results[i] = parsed[n]
+            if cache_key is not None:
+                llm_cache.set(cache_key, parsed[n], cache_token)
+
+    return results
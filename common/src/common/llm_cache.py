@@ -0,0 +1,234 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+import numpy as np
+
+# Optional Redis backend
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from .config import (
+    DATA_DIR,
+    LLM_CACHE_BACKEND,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_TTL,
+    LLM_CACHE_SEMANTIC,
+    LLM_CACHE_SEMANTIC_MODEL,
+    LLM_CACHE_SEMANTIC_THRESHOLD,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Key/value store for LLM responses. `get` returns None on a miss."""
+
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries=LLM_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires = time.time() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class FileCache:
+    """JSON file per key under a cache directory, so hits survive across runs."""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(DATA_DIR, "llm_cache")
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        expires = entry.get("expires")
+        if expires is not None and expires < time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key, value, ttl=None):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {"expires": time.time() + ttl if ttl else None, "value": value}
+        # Write to a uniquely named temp file then rename, so a concurrent
+        # reader never sees a partial file and writers of the same key don't
+        # clobber each other's temp file
+        f = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+        )
+        try:
+            with f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(f.name, self._path(key))
+        except BaseException:
+            # Don't leave a half-written temp file behind
+            os.unlink(f.name)
+            raise
+
+
+class RedisCache:
+    """Shared cache in Redis, for several machines or processes."""
+
+    def __init__(self, url=None):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis not installed. Run: pip install redis")
+        self.client = redis.Redis.from_url(
+            url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        )
+
+    def get(self, key):
+        data = self.client.get(f"llm_cache:{key}")
+        return json.loads(data) if data is not None else None
+
+    def set(self, key, value, ttl=None):
+        self.client.set(f"llm_cache:{key}", json.dumps(value), ex=ttl)
+
+
+class SemanticIndex:
+    """Maps near-duplicate texts to the exact-cache key of an earlier response.
+
+    Vectors are normalized, so the dot product is the cosine similarity.
+    """
+
+    def __init__(self, threshold=LLM_CACHE_SEMANTIC_THRESHOLD, model=None):
+        self.threshold = threshold
+        self.model = model or LLM_CACHE_SEMANTIC_MODEL
+        self._embeddings = None
+        self._vectors = []
+        self._keys = []
+        self._lock = threading.Lock()
+
+    def _embed(self, text):
+        if self._embeddings is None:
+            from .embeddings import get_embeddings
+
+            self._embeddings = get_embeddings("sentence-transformers", self.model)
+        vector = np.asarray(self._embeddings.embed_query(text), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def lookup(self, text):
+        """Return (key of the most similar text or None, embedding of text)."""
+        vector = self._embed(text)
+        with self._lock:
+            if not self._keys:
+                return None, vector
+            scores = np.stack(self._vectors) @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return self._keys[best], vector
+        return None, vector
+
+    def add(self, vector, key):
+        with self._lock:
+            self._vectors.append(vector)
+            self._keys.append(key)
+
+
+def make_cache_key(provider, model, prompt, title, content):
+    """Exact-match key over everything that determines the response."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "prompt": prompt,
+            "title": title,
+            "content": content,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Exact cache in front of an optional semantic (near-duplicate) tier."""
+
+    def __init__(self, backend: CacheBackend, semantic: Optional[SemanticIndex] = None):
+        self.backend = backend
+        self.semantic = semantic
+
+    def get(self, key, text=None):
+        """Return the cached entry for key, or for a near-duplicate of text.
+
+        Entries are {"result": ...} so that a cached None (e.g. a skipped
+        article) is distinguishable from a miss. On a semantic miss the
+        returned token must be passed to `set` to index the new response.
+        """
+        # A broken cache must never fail the LLM call it sits in front of
+        try:
+            entry = self.backend.get(key)
+            if entry is not None or self.semantic is None or text is None:
+                return entry, None
+            similar_key, vector = self.semantic.lookup(text)
+            if similar_key is not None:
+                entry = self.backend.get(similar_key)
+                if entry is not None:
+                    logger.info("LLM cache: near-duplicate hit")
+                    return entry, None
+            return None, vector
+        except Exception as e:
+            logger.warning("LLM cache lookup failed: %s: %s", type(e).__name__, e)
+            return None, None
+
+    def set(self, key, result, token=None, ttl=LLM_CACHE_TTL):
+        try:
+            self.backend.set(key, {"result": result}, ttl=ttl)
+            if self.semantic is not None and token is not None:
+                self.semantic.add(token, key)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s: %s", type(e).__name__, e)
+
+
+def create_cache(backend=LLM_CACHE_BACKEND, semantic=LLM_CACHE_SEMANTIC):
+    """Build the response cache configured in common.config, or None if disabled."""
+    if backend == "memory":
+        store = MemoryCache()
+    elif backend == "file":
+        store = FileCache()
+    elif backend == "redis":
+        store = RedisCache()
+    elif backend in (None, "none"):
+        return None
+    else:
+        raise ValueError(f"Unsupported LLM cache backend: {backend}")
+    return LLMResponseCache(store, SemanticIndex() if semantic else None)
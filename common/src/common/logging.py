@@ -1,15 +1,21 @@
 import logging
 import sys
 
+_configured = False
+
 
 def setup_logging(
     level=logging.INFO,
     format_str="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 ):
-    """Setup basic logging configuration."""
+    """Setup basic logging configuration, once per process."""
+    global _configured
+    if _configured:
+        return
     logging.basicConfig(
         level=level, format=format_str, handlers=[logging.StreamHandler(sys.stdout)]
     )
     # Suppress noisy libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    _configured = True
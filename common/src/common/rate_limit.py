@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least `interval` seconds apart.
+
+    Each caller reserves the next free slot under the lock and then waits
+    outside it, so sync threads and async tasks can share one limiter.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_call = 0.0
+
+    def _reserve(self):
+        """Reserve the next slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_call - now
+            self._next_call = max(now, self._next_call) + self.interval
+        return delay
+
+    @property
+    def next_free(self):
+        """Monotonic time at which the next slot opens."""
+        return self._next_call
+
+    def wait(self):
+        """Block until the caller's slot comes up, reserving the next one."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Async variant of wait() that yields to the event loop instead of blocking."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
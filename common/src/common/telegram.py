@@ -1,11 +1,41 @@
 import asyncio
+import json
 import logging
+import os
+import weakref
+
+# Faster JSON parsing when available
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from telegram import Bot
 from telegram.constants import ParseMode
 from .config import get_telegram_bot_token, get_telegram_chat_id
 
 logger = logging.getLogger(__name__)
 
+# Messages in flight at once, well under Telegram's ~30 messages/sec per chat
+MAX_CONCURRENT_SENDS = 4
+
+# One Bot per event loop, shared by every send in that loop. A Bot's HTTP
+# client is bound to the loop it first ran on, so each asyncio.run() of the
+# sync wrappers gets its own.
+_bots = weakref.WeakKeyDictionary()
+
+
+def _get_bot():
+    """Return the Bot for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    bot = _bots.get(loop)
+    if bot is None:
+        bot = Bot(token=get_telegram_bot_token())
+        _bots[loop] = bot
+    return bot
+
 
 async def _send_message_with_fallback(bot, chat_id, text, parse_mode):
     """Send a message with fallback to plain text if parsing fails."""
@@ -16,52 +46,99 @@ async def _send_message_with_fallback(bot, chat_id, text, parse_mode):
         await bot.send_message(chat_id=chat_id, text=text, parse_mode=ParseMode.HTML)
 
 
+def _iter_chunks(text, max_length):
+    """Yield consecutive max_length slices of text, one at a time."""
+    for i in range(0, len(text), max_length):
+        yield text[i : i + max_length]
+
+
 async def _send_text_in_chunks(bot, chat_id, text, max_length):
     """Send long text in chunks to avoid Telegram message length limit."""
-    chunks = [text[i : i + max_length] for i in range(0, len(text), max_length)]
-    for chunk in chunks:
+    # Chunks are slices of one text, so they are sent in order, one at a time;
+    # slicing lazily keeps only the chunk being sent alive
+    for chunk in _iter_chunks(text, max_length):
+        await bot.send_message(chat_id=chat_id, text=chunk, parse_mode=ParseMode.HTML)
+
+
+async def _send_messages_concurrently(bot, chat_id, messages, parse_mode):
+    """Send independent messages concurrently, at most MAX_CONCURRENT_SENDS at a time.
+
+    Telegram may deliver them out of order, so only use this for messages
+    that stand on their own.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+    async def send_one(message):
+        async with semaphore:
+            await _send_message_with_fallback(bot, chat_id, message, parse_mode)
+
+    await asyncio.gather(*(send_one(message) for message in messages))
+
+
+def _pack_messages(messages, max_length, separator):
+    """Join consecutive messages into as few texts of at most max_length as fit."""
+    buffer = []
+    buffer_length = 0
+    for message in messages:
+        added = len(message) + (len(separator) if buffer else 0)
+        if buffer and buffer_length + added > max_length:
+            yield separator.join(buffer)
+            buffer = []
+            buffer_length = 0
+            added = len(message)
+        buffer.append(message)
+        buffer_length += added
+    if buffer:
+        yield separator.join(buffer)
+
+
+async def _send_file_in_chunks(bot, chat_id, f, max_length):
+    """Stream an open text file to Telegram in max_length chunks.
+
+    Each read runs in a worker thread so a large file never blocks the event
+    loop, and only one chunk is held in memory at a time.
+    """
+    while chunk := await asyncio.to_thread(f.read, max_length):
         await bot.send_message(chat_id=chat_id, text=chunk, parse_mode=ParseMode.HTML)
 
 
 async def send_digest_via_telegram(date_str):
     """Send the digest for the given date via Telegram."""
-    bot_token = get_telegram_bot_token()
     chat_id = get_telegram_chat_id()
-    bot = Bot(token=bot_token)
+    bot = _get_bot()
 
     digest_path = f"data/digests/{date_str}.md"
     try:
-        with open(digest_path, "r", encoding="utf-8") as f:
-            digest_content = f.read()
+        f = open(digest_path, "r", encoding="utf-8")
     except FileNotFoundError:
         raise FileNotFoundError(f"Digest file not found: {digest_path}")
 
-    await _send_message_with_fallback(
-        bot,
-        chat_id,
-        f"*Daily Tech Newsletter Digest - {date_str}*\n\n",
-        ParseMode.MARKDOWN,
-    )
-    await _send_text_in_chunks(bot, chat_id, digest_content, 4096)
+    with f:
+        await _send_message_with_fallback(
+            bot,
+            chat_id,
+            f"*Daily Tech Newsletter Digest - {date_str}*\n\n",
+            ParseMode.MARKDOWN,
+        )
+        await _send_file_in_chunks(bot, chat_id, f, 4096)
 
 
 async def send_articles_via_telegram(date_str):
     """Send articles markdown for the given date via Telegram."""
-    bot_token = get_telegram_bot_token()
     chat_id = get_telegram_chat_id()
-    bot = Bot(token=bot_token)
+    bot = _get_bot()
 
     articles_path = f"data/articles/{date_str}.md"
     try:
-        with open(articles_path, "r", encoding="utf-8") as f:
-            articles_content = f.read()
+        f = open(articles_path, "r", encoding="utf-8")
     except FileNotFoundError:
         raise FileNotFoundError(f"Articles file not found: {articles_path}")
 
-    await _send_message_with_fallback(
-        bot, chat_id, f"*Daily Tech Articles - {date_str}*\n\n", ParseMode.MARKDOWN
-    )
-    await _send_text_in_chunks(bot, chat_id, articles_content, 4096)
+    with f:
+        await _send_message_with_fallback(
+            bot, chat_id, f"*Daily Tech Articles - {date_str}*\n\n", ParseMode.MARKDOWN
+        )
+        await _send_file_in_chunks(bot, chat_id, f, 4096)
 
 
 def send_articles_sync(date_str):
@@ -69,20 +146,41 @@ def send_articles_sync(date_str):
     asyncio.run(send_articles_via_telegram(date_str))
 
 
+def _load_json(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def _send_summaries_audio(bot, chat_id, audio_path, date_str):
+    """Upload the combined audio summary, logging rather than raising on failure."""
+    try:
+        audio = await asyncio.to_thread(_read_bytes, audio_path)
+        await bot.send_audio(
+            chat_id=chat_id,
+            audio=audio,
+            title=f"Tech News Audio Summary - {date_str}",
+            caption="🎵 Combined audio summary of today's tech news",
+        )
+        logger.info(f"Sent audio file for {date_str}")
+    except Exception as e:
+        logger.error(f"Failed to send audio: {e}")
+
+
 async def send_summaries_via_telegram(date_str, no_audio=False):
     """Send article summaries with links via Telegram."""
-    import json
-    import os
-
-    bot_token = get_telegram_bot_token()
     chat_id = get_telegram_chat_id()
-    bot = Bot(token=bot_token)
+    bot = _get_bot()
 
     # Load summaries
     summaries_path = f"data/{date_str}/summaries.json"
     try:
-        with open(summaries_path, "r", encoding="utf-8") as f:
-            summaries = json.load(f)
+        summaries = await asyncio.to_thread(_load_json, summaries_path)
     except FileNotFoundError:
         raise FileNotFoundError(f"Summaries file not found: {summaries_path}")
 
@@ -95,21 +193,26 @@ async def send_summaries_via_telegram(date_str, no_audio=False):
         bot, chat_id, f"*📰 Tech News Summary - {date_str}*\n\n", ParseMode.MARKDOWN
     )
 
-    # Send each summary as a separate message
+    # Build one message per summary, then pack them into as few Telegram
+    # messages as fit, instead of one round-trip and notification each
+    messages = []
     for summary in summaries:
         title = summary["title"]
         link = summary["link"]
         summary_text = summary["summary"]
 
-        # Send individual article summary
+        # Individual article summary
         message = f"*📌 {title}*\n\n{summary_text}\n\n🔗 {link}"
 
         # If message is too long for Telegram (4000 chars), truncate with ellipsis
         if len(message) > 3950:
             # Leave room for ellipsis and some buffer
             message = message[:3950] + "..."
+        messages.append(message)
+    packed = list(_pack_messages(messages, 3950, "\n\n---\n\n"))
 
-        await _send_message_with_fallback(bot, chat_id, message, ParseMode.MARKDOWN)
+    # Each packed message holds whole summaries, so they don't need to arrive in order
+    await _send_messages_concurrently(bot, chat_id, packed, ParseMode.MARKDOWN)
 
     # Send footer with audio status only if not skipping audio
     if not no_audio:
@@ -118,21 +221,16 @@ async def send_summaries_via_telegram(date_str, no_audio=False):
         else:
             footer = "*❌ Audio summary not generated*"
 
-        await _send_message_with_fallback(bot, chat_id, footer, ParseMode.MARKDOWN)
-
-        # Send audio file if it exists and not skipping audio
+        footer_send = _send_message_with_fallback(
+            bot, chat_id, footer, ParseMode.MARKDOWN
+        )
         if audio_exists:
-            try:
-                with open(audio_path, "rb") as audio_file:
-                    await bot.send_audio(
-                        chat_id=chat_id,
-                        audio=audio_file,
-                        title=f"Tech News Audio Summary - {date_str}",
-                        caption="🎵 Combined audio summary of today's tech news",
-                    )
-                    logger.info(f"Sent audio file for {date_str}")
-            except Exception as e:
-                logger.error(f"Failed to send audio: {e}")
+            # The upload can take seconds; the footer doesn't need to wait for it
+            await asyncio.gather(
+                footer_send, _send_summaries_audio(bot, chat_id, audio_path, date_str)
+            )
+        else:
+            await footer_send
 
 
 def send_summaries_sync(date_str, no_audio=False):
@@ -145,11 +243,22 @@ def send_digest_sync(date_str):
     asyncio.run(send_digest_via_telegram(date_str))
 
 
+async def send_daily_via_telegram(date_str, no_audio=False):
+    """Send the digest, articles and summaries for a date over one shared Bot."""
+    await send_digest_via_telegram(date_str)
+    await send_articles_via_telegram(date_str)
+    await send_summaries_via_telegram(date_str, no_audio=no_audio)
+
+
+def send_daily_sync(date_str, no_audio=False):
+    """Synchronous wrapper for sending everything for a date in one event loop."""
+    asyncio.run(send_daily_via_telegram(date_str, no_audio=no_audio))
+
+
 async def send_linkedin_post_via_telegram(date_str):
     """Send LinkedIn post for the given date via Telegram."""
-    bot_token = get_telegram_bot_token()
     chat_id = get_telegram_chat_id()
-    bot = Bot(token=bot_token)
+    bot = _get_bot()
 
     linkedin_post_path = f"data/{date_str}/linkedin_post.txt"
     try:
@@ -177,9 +286,8 @@ def send_linkedin_post_sync(date_str):
 
 async def send_linkedin_post_content_via_telegram(title, post_content):
     """Send a LinkedIn post content for a specific article via Telegram."""
-    bot_token = get_telegram_bot_token()
     chat_id = get_telegram_chat_id()
-    bot = Bot(token=bot_token)
+    bot = _get_bot()
 
     # Send header
     await _send_message_with_fallback(
@@ -8,19 +8,31 @@ from pathlib import Path
 # Add the parent directories to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from common.audio import generate_audio_chunk
+from common.audio import (
+    RateLimiter,
+    SynthesisCache,
+    _atempo_filter,
+    _pack_sentences,
+    clean_text_for_audio,
+    generate_audio_chunk,
+    tts_wait_time,
+    write_samples_mp3,
+)
 
 
 class TestAudioFunctions:
     """Test cases for audio-related functions"""
 
-    @patch("common.audio.last_tts_call", 0)
-    @patch("time.time")
+    @patch("common.audio.tts_rate_limiter", new_callable=lambda: RateLimiter(tts_wait_time))
+    @patch("time.monotonic")
     @patch("time.sleep")
-    @patch("gtts.gTTS")
-    def test_generate_audio_chunk_success(self, mock_gtts, mock_sleep, mock_time):
+    @patch("common.audio.gTTS")
+    def test_generate_audio_chunk_success(
+        self, mock_gtts, mock_sleep, mock_time, mock_limiter
+    ):
         """Test successful audio chunk generation"""
         mock_time.return_value = 10.0  # Current time
+        mock_limiter._next_call = 10.0 + tts_wait_time  # A call was just made
 
         mock_tts_instance = MagicMock()
         mock_gtts.return_value = mock_tts_instance
@@ -29,26 +41,27 @@ class TestAudioFunctions:
             temp_path = temp_file.name
 
         try:
-            generate_audio_chunk("Test text", temp_path)
+            generate_audio_chunk("Test text", temp_path, speed=1.0)
 
             # Verify gTTS was called correctly
             mock_gtts.assert_called_once_with(text="Test text", lang="en", slow=False)
-            mock_tts_instance.save.assert_called_once_with(temp_path)
+            mock_tts_instance.write_to_fp.assert_called_once()
 
             # Check that sleep was called (rate limiting)
-            mock_sleep.assert_called_once()
+            mock_sleep.assert_called_once_with(tts_wait_time)
 
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
-    @patch("common.audio.last_tts_call", 10.0)
-    @patch("time.time")
+    @patch("common.audio.tts_rate_limiter", new_callable=lambda: RateLimiter(tts_wait_time))
+    @patch("time.monotonic")
     @patch("time.sleep")
-    @patch("gtts.gTTS")
-    @patch("pydub.AudioSegment.from_mp3")
+    @patch("common.audio.gTTS")
+    @patch("common.audio.os.replace")
+    @patch("common.audio.subprocess.check_call")
     def test_generate_audio_chunk_with_speed_adjustment(
-        self, mock_from_mp3, mock_gtts, mock_sleep, mock_time
+        self, mock_check_call, mock_replace, mock_gtts, mock_sleep, mock_time, mock_limiter
     ):
         """Test audio chunk generation with speed adjustment"""
         from common.config import AUDIO_SPEED
@@ -56,31 +69,101 @@ class TestAudioFunctions:
         if AUDIO_SPEED == 1.0:
             pytest.skip("Audio speed is 1.0, no speed adjustment needed")
 
-        mock_time.return_value = 10.1  # Just over wait time
+        mock_time.return_value = 10.1  # No previous call, so no wait
 
         mock_tts_instance = MagicMock()
         mock_gtts.return_value = mock_tts_instance
 
-        mock_audio_segment = MagicMock()
-        mock_from_mp3.return_value = mock_audio_segment
-        mock_sped_audio = MagicMock()
-        mock_audio_segment.speedup.return_value = mock_sped_audio
-
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
             temp_path = temp_file.name
 
         try:
             generate_audio_chunk("Test text", temp_path)
 
-            # Verify speed adjustment was applied
-            mock_from_mp3.assert_called_once_with(temp_path)
-            mock_audio_segment.speedup.assert_called_once_with(
-                playback_speed=AUDIO_SPEED
-            )
-            mock_sped_audio.export.assert_called_once()
+            # Verify speed adjustment was applied with ffmpeg's atempo filter
+            mock_check_call.assert_called_once()
+            cmd = mock_check_call.call_args[0][0]
+            assert cmd[cmd.index("-i") + 1] == temp_path
+            assert cmd[cmd.index("-filter:a") + 1] == f"atempo={AUDIO_SPEED:g}"
+            mock_replace.assert_called_once_with(temp_path + ".out", temp_path)
 
             mock_sleep.assert_not_called()  # No sleep needed
 
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+
+    def test_clean_text_for_audio_strips_markdown(self):
+        """Test markdown is stripped in a single pass, including nested constructs"""
+        text = (
+            "# Title\n\nSome **bold [link](http://x.y/z)** and *it* and _u_.\n\n\n\n"
+            "## H2\n`code` here\n```py\nx=1\n```\nend"
+        )
+
+        result = clean_text_for_audio(text)
+
+        assert result == "Title\n\nSome bold link and it and u.\n\nH2\ncode here\n\nend"
+
+    def test_clean_text_for_audio_drops_urls_and_stray_markers(self):
+        """Test bare URLs, quote markers and unpaired emphasis are not spoken"""
+        text = "> Quote (see https://x.y/a_b?c=1) and a stray * marker"
+
+        result = clean_text_for_audio(text)
+
+        assert result == "Quote (see ) and a stray  marker"
+
+    def test_clean_text_for_audio_keeps_code_span_text(self):
+        """Test emphasis markers inside code spans don't pair up with text outside them"""
+        assert clean_text_for_audio("Use `**kwargs` here") == "Use kwargs here"
+        assert clean_text_for_audio("`my_var_name` and *x*") == "my_var_name and x"
+        assert clean_text_for_audio("Call `a*b*c`, then _d_") == "Call abc, then d"
+
+    @patch("common.audio._SNDFILE_MP3", False)
+    @patch("common.audio._pipe_to_ffmpeg")
+    def test_write_samples_mp3_falls_back_to_ffmpeg(self, mock_pipe):
+        """Test samples are piped to ffmpeg as raw float32 when libsndfile lacks MP3"""
+        mock_pipe.return_value = 0
+
+        write_samples_mp3("out.mp3", [0.0, 0.5], 16000)
+
+        cmd, chunks = mock_pipe.call_args.args
+        assert cmd[-1] == "out.mp3" and "f32le" in cmd and "16000" in cmd
+        assert chunks == [b"\x00\x00\x00\x00\x00\x00\x00?"]
+
+    @patch("common.audio._SNDFILE_MP3", False)
+    @patch("common.audio._pipe_to_ffmpeg", side_effect=FileNotFoundError)
+    def test_write_samples_mp3_without_encoder_fails_clearly(self, mock_pipe):
+        """Test a missing ffmpeg on an old libsndfile raises a readable error"""
+        with pytest.raises(RuntimeError, match="libsndfile 1.1.0"):
+            write_samples_mp3("out.mp3", [0.0], 16000)
+
+    def test_pack_sentences_splits_between_sentences(self):
+        """Test chunks end at sentence boundaries, and overlong sentences split by word"""
+        text = "One two. Three four! Five six? " + "word " * 10
+
+        result = _pack_sentences(text, 20)
+
+        assert result[:3] == ["One two.", "Three four!", "Five six?"]
+        assert all(len(chunk) < 20 for chunk in result)
+        assert " ".join(result[3:]) == " ".join(["word"] * 10)
+
+    def test_synthesis_cache_evicts_least_recently_used(self, tmp_path):
+        """Test cached chunks round-trip and the oldest entry is evicted when full"""
+        cache = SynthesisCache(str(tmp_path), max_entries=2)
+        cache.set("a", "en", b"A")
+        cache.set("b", "en", b"B")
+        # Backdate "a" so that it is the least recently used
+        path_a = cache._path("a", "en")
+        os.utime(path_a, (0, 0))
+        cache.set("c", "en", b"C")
+
+        assert cache.get("a", "en") is None
+        assert cache.get("b", "en") == b"B"
+        assert cache.get("c", "en") == b"C"
+        assert cache.get("b", "fr") is None
+
+    def test_atempo_filter_chains_out_of_range_speeds(self):
+        """Test speeds outside atempo's 0.5-2.0 range are split into stages"""
+        assert _atempo_filter(1.25) == "atempo=1.25"
+        assert _atempo_filter(3.0) == "atempo=2,atempo=1.5"
+        assert _atempo_filter(0.25) == "atempo=0.5,atempo=0.5"
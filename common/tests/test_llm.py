@@ -8,7 +8,21 @@ from pathlib import Path
 # Add the parent directories to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from common.llm import get_llm, summarize_article
+from common.llm import (
+    _parse_batch_response,
+    _read_content,
+    cached_invoke,
+    get_llm,
+    summarize_article,
+)
+from common.llm_cache import LLMResponseCache, MemoryCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache():
+    """Give each test an empty in-memory cache instead of the on-disk one"""
+    with patch("common.llm.llm_cache", LLMResponseCache(MemoryCache())):
+        yield
 
 
 class TestLLMFunctions:
@@ -36,54 +50,74 @@ class TestLLMFunctions:
         mock_client.get_llm.assert_called_once_with("openai")
         assert result == mock_llm
 
-    @patch("common.llm.last_llm_call", 0)
-    @patch("time.time")
-    @patch("time.sleep")
-    @patch("common.llm.get_llm")
-    def test_summarize_article_success(self, mock_get_llm, mock_sleep, mock_time):
+    @patch("common.llm._SUMMARIZE_PROMPT")
+    @patch("common.llm.acquire_llm")
+    def test_summarize_article_success(self, mock_acquire_llm, mock_prompt):
         """Test successful article summarization"""
-        mock_time.return_value = 10.0  # Current time
-        mock_llm = MagicMock()
-        mock_response = MagicMock()
-        mock_response.content = "Summary content"
-        mock_llm.invoke.return_value = mock_response
-        mock_get_llm.return_value = mock_llm
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content=" Summary content \n")
+        mock_prompt.__or__.return_value = mock_chain
 
         article = {"title": "Test Article", "summary": "Article content"}
 
         result = summarize_article(article, "gemini")
 
         assert result == "Summary content"
-        mock_get_llm.assert_called_once_with("gemini")
-        mock_llm.invoke.assert_called_once()
-
-        # Check that sleep was called (rate limiting)
-        mock_sleep.assert_called_once()
-
-    @patch("common.llm.last_llm_call", 10.0)
-    @patch("time.time")
-    @patch("time.sleep")
-    @patch("common.llm.get_llm")
-    @patch("os.path.exists")
-    @patch("builtins.open", new_callable=mock_open, read_data="File content")
+        # The LLM is acquired through the rate limiter
+        mock_acquire_llm.assert_called_once_with("gemini")
+        mock_prompt.__or__.assert_called_once_with(mock_acquire_llm.return_value)
+        mock_chain.invoke.assert_called_once_with(
+            {"title": "Test Article", "content": "Article content"}
+        )
+
+    @patch("common.llm._SUMMARIZE_PROMPT")
+    @patch("common.llm.acquire_llm")
+    @patch("os.path.getmtime")
+    @patch("builtins.open", new_callable=mock_open, read_data=b"File content")
     def test_summarize_article_from_file(
-        self, mock_file_open, mock_exists, mock_get_llm, mock_sleep, mock_time
+        self, mock_file_open, mock_getmtime, mock_acquire_llm, mock_prompt
     ):
         """Test article summarization with content from file"""
-        mock_time.return_value = 10.1  # Just over the wait time
-        mock_exists.return_value = True
-        mock_llm = MagicMock()
-        mock_response = MagicMock()
-        mock_response.content = "File summary"
-        mock_llm.invoke.return_value = mock_response
-        mock_get_llm.return_value = mock_llm
+        _read_content.cache_clear()
+        mock_getmtime.return_value = 1.0
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content="File summary")
+        mock_prompt.__or__.return_value = mock_chain
 
         article = {"title": "Test Article", "content_path": "/path/to/content.txt"}
 
         result = summarize_article(article, "openai")
 
         assert result == "File summary"
-        mock_file_open.assert_called_once_with(
-            "/path/to/content.txt", "r", encoding="utf-8"
+        mock_file_open.assert_called_once_with("/path/to/content.txt", "rb")
+        mock_acquire_llm.assert_called_once_with("openai")
+        mock_chain.invoke.assert_called_once_with(
+            {"title": "Test Article", "content": "File content"}
+        )
+
+    def test_cached_invoke_only_calls_on_miss(self):
+        """Test that a cached prompt response is returned without calling the LLM again"""
+        invoke = MagicMock(return_value="Post")
+        with patch("common.llm.llm_cache", LLMResponseCache(MemoryCache())):
+            first = cached_invoke("gemini", "template", "Title", "Summary", invoke)
+            second = cached_invoke("gemini", "template", "Title", "Summary", invoke)
+
+        assert first == second == "Post"
+        invoke.assert_called_once()
+
+    def test_parse_batch_response(self):
+        """Test parsing a JSON-lines batch response into per-article results"""
+        result = (
+            "```json\n"
+            '{"id": 1, "skip": false, "categories": ["AI", " Databases "], "summary": "First."}\n'
+            '{"id": 2, "skip": true, "categories": [], "summary": ""}\n'
+            '{"id": 9, "skip": false, "categories": [], "summary": "Out of range."}\n'
+            "```"
         )
-        mock_sleep.assert_not_called()  # No sleep needed
+
+        parsed = _parse_batch_response(result, 3)
+
+        assert parsed == {
+            0: {"summary": "First.", "categories": ["AI", "Databases"]},
+            1: None,
+        }
@@ -0,0 +1,68 @@
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the parent directories to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from common.llm_cache import (
+    FileCache,
+    LLMResponseCache,
+    MemoryCache,
+    make_cache_key,
+)
+
+
+class TestLLMCache:
+    """Test cases for the LLM response cache"""
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        """Test that the memory backend drops the oldest entry when full"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    @patch("common.llm_cache.time.time")
+    def test_file_cache_round_trip_and_expiry(self, mock_time, tmp_path):
+        """Test that file entries are read back until their TTL passes"""
+        mock_time.return_value = 100.0
+        cache = FileCache(str(tmp_path))
+        cache.set("key", {"result": "summary"}, ttl=10)
+
+        assert cache.get("key") == {"result": "summary"}
+        mock_time.return_value = 111.0
+        assert cache.get("key") is None
+        assert cache.get("missing") is None
+
+    def test_file_cache_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test that a value that can't be serialized leaves the cache dir clean"""
+        cache = FileCache(str(tmp_path))
+
+        with pytest.raises(TypeError):
+            cache.set("key", object())
+
+        assert list(tmp_path.iterdir()) == []
+        assert cache.get("key") is None
+
+    def test_cached_none_result_is_a_hit(self):
+        """Test that a skipped article (None result) is cached, not treated as a miss"""
+        cache = LLMResponseCache(MemoryCache())
+        key = make_cache_key("gemini", "model", "prompt", "Title", "Content")
+        cache.set(key, None)
+
+        entry, _ = cache.get(key)
+        assert entry == {"result": None}
+
+    def test_cache_key_depends_on_content(self):
+        """Test that different content yields a different cache key"""
+        key_a = make_cache_key("gemini", "model", "prompt", "Title", "A")
+        key_b = make_cache_key("gemini", "model", "prompt", "Title", "B")
+
+        assert key_a != key_b
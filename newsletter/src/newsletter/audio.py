@@ -1,33 +1,35 @@
+import asyncio
 import os
+
 from common.audio import generate_audio as common_generate_audio, clean_text_for_audio
 from common.config import DATA_DIR
 from .db import get_summary_by_article_id
+from .summaries import load_summaries, safe_title
 
 
 def generate_summaries_audio(date_str, tts_provider="microsoft"):
     """Generate combined audio for all article summaries."""
-    import json
-
     date_dir = os.path.join(DATA_DIR, date_str)
     summaries_file = os.path.join(date_dir, "summaries.json")
     audio_file = os.path.join(date_dir, "summaries.mp3")
 
-    if not os.path.exists(summaries_file):
+    try:
+        summaries = load_summaries(summaries_file)
+    except FileNotFoundError:
         print(f"No summaries found for {date_str}")
         return
 
-    with open(summaries_file, "r") as f:
-        summaries = json.load(f)
-
     if not summaries:
         print(f"No summaries to generate audio for {date_str}")
         return
 
     # Combine all summaries into one text
-    combined_text = f"Tech News Summary for {date_str}\n\n"
-    for summary in summaries:
-        combined_text += f"Article: {summary['title']}\n"
-        combined_text += f"Summary: {summary['summary']}\n\n"
+    parts = [f"Tech News Summary for {date_str}"]
+    parts.extend(
+        f"Article: {summary['title']}\nSummary: {summary['summary']}"
+        for summary in summaries
+    )
+    combined_text = "\n\n".join(parts)
 
     # Clean the text for plain audio
     clean_text = clean_text_for_audio(combined_text)
@@ -52,12 +54,8 @@ def generate_summary_audio(article_id, summary, tts_provider="gtts"):
     # Clean the text for audio
     clean_text = clean_text_for_audio(audio_text)
 
-    # Create audio directory if needed
-    audio_dir = os.path.join(DATA_DIR, "audio")
-    os.makedirs(audio_dir, exist_ok=True)
-
-    # Generate filename
-    audio_file = os.path.join(audio_dir, f"summary_{article_id}.mp3")
+    # Generate filename; generate_audio creates the directory if needed
+    audio_file = os.path.join(DATA_DIR, "audio", f"summary_{article_id}.mp3")
 
     # Generate audio
     common_generate_audio(clean_text, audio_file, tts_provider)
@@ -74,9 +72,26 @@ def generate_article_audio(date_str, title, link):
     text = f"Article: {title}. Link: {link}"
     # Clean the text for plain audio
     clean_text = clean_text_for_audio(text)
-    safe_title = "".join(
-        c for c in title if c.isalnum() or c in (" ", "-", "_")
-    ).rstrip()
-    audio_file = os.path.join(DATA_DIR, date_str, f"{safe_title}.mp3")
+    audio_file = os.path.join(DATA_DIR, date_str, f"{safe_title(title)}.mp3")
     common_generate_audio(clean_text, audio_file)
     return audio_file
+
+
+async def generate_date_audio_async(date_str, articles, tts_provider="gtts"):
+    """Generate the combined summaries audio and per-article audio for a date concurrently.
+
+    `articles` is an iterable of (title, link) pairs. Each job runs in a worker
+    thread; gTTS calls still share the rate limiter in common.audio.
+    """
+    await asyncio.gather(
+        asyncio.to_thread(generate_summaries_audio, date_str, tts_provider),
+        *(
+            asyncio.to_thread(generate_article_audio, date_str, title, link)
+            for title, link in articles
+        ),
+    )
+
+
+def generate_date_audio_sync(date_str, articles, tts_provider="gtts"):
+    """Synchronous wrapper for generating all audio for a date."""
+    asyncio.run(generate_date_audio_async(date_str, articles, tts_provider))
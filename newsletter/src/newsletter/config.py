@@ -3,3 +3,18 @@ from .sources import RSS_SOURCES, SCRAPING_SOURCES, ALL_SOURCES
 
 # Sources: list of RSS feed URLs for tech company blogs (backward compatibility)
 SOURCES = ALL_SOURCES
+
+# Articles with less body text than this are skipped as teasers or stubs
+MIN_ARTICLE_CHARS = 1000
+
+# RSS feeds downloaded at once, over one pooled HTTP client
+FETCH_MAX_WORKERS = 8
+
+# Scraping sources crawled at once; each worker drives its own headless browser
+SCRAPE_MAX_WORKERS = 4
+
+# Article page loads allowed per second against any one host
+SCRAPE_REQUESTS_PER_SECOND = 1.0
+
+# Article pages a source's browser loads at once (each load can take seconds)
+SCRAPE_PAGE_CONCURRENCY = 6
@@ -1,291 +1,487 @@
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from common.config import DATA_DIR
 
 DB_PATH = os.path.join(DATA_DIR, "newsletter.db")
 
+# One connection per process, shared by the helpers below and serialized by
+# the lock, instead of opening (and warming up) a fresh handle on every call
+_conn = None
+_conn_lock = threading.RLock()
 
-def get_db_connection():
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(DB_PATH)
+
+def _configure_connection(conn):
+    """Apply the row factory and pragmas every connection is opened with."""
     conn.row_factory = sqlite3.Row
+    # WAL lets readers run alongside the writer, and with it
+    # synchronous=NORMAL only syncs at checkpoints, not every commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Read pages through a 256 MB memory map instead of read() calls
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
     return conn
 
 
+def get_db_connection():
+    """Get database connection with row factory."""
+    return _configure_connection(sqlite3.connect(DB_PATH))
+
+
+@contextmanager
+def _shared_connection():
+    """Lock and yield the shared connection, opening it on first use."""
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            _conn = _configure_connection(
+                sqlite3.connect(DB_PATH, check_same_thread=False)
+            )
+        try:
+            yield _conn
+        finally:
+            # Never leave a half-done transaction open on the shared handle
+            if _conn.in_transaction:
+                _conn.rollback()
+
+
 def init_db():
     """Initialize database tables."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    # Create articles table
-    cursor.execute(
+        # Create articles table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                link TEXT UNIQUE NOT NULL,
+                published TEXT,
+                content TEXT,
+                source TEXT,
+                fetched_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                content_fetched BOOLEAN DEFAULT FALSE,
+                is_summarized BOOLEAN DEFAULT FALSE,
+                telegram_sent BOOLEAN DEFAULT FALSE,
+                audio_generated BOOLEAN DEFAULT FALSE,
+                linkedin_posted BOOLEAN DEFAULT FALSE,
+                processed_at TEXT
+            )
         """
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            link TEXT UNIQUE NOT NULL,
-            published TEXT,
-            content TEXT,
-            source TEXT,
-            fetched_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            content_fetched BOOLEAN DEFAULT FALSE,
-            is_summarized BOOLEAN DEFAULT FALSE,
-            telegram_sent BOOLEAN DEFAULT FALSE,
-            audio_generated BOOLEAN DEFAULT FALSE,
-            linkedin_posted BOOLEAN DEFAULT FALSE,
-            processed_at TEXT
         )
-    """
-    )
 
-    # Create summaries table
-    cursor.execute(
+        # Create summaries table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS summaries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                article_id INTEGER,
+                summary TEXT NOT NULL,
+                generated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                provider TEXT,
+                FOREIGN KEY (article_id) REFERENCES articles (id)
+            )
         """
-        CREATE TABLE IF NOT EXISTS summaries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            article_id INTEGER,
-            summary TEXT NOT NULL,
-            generated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            provider TEXT,
-            FOREIGN KEY (article_id) REFERENCES articles (id)
         )
-    """
-    )
 
-    # Create processing_log table
-    cursor.execute(
+        # Create processing_log table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS processing_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                article_id INTEGER,
+                action TEXT NOT NULL,
+                timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (article_id) REFERENCES articles (id)
+            )
         """
-        CREATE TABLE IF NOT EXISTS processing_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            article_id INTEGER,
-            action TEXT NOT NULL,
-            timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (article_id) REFERENCES articles (id)
         )
-    """
-    )
-
-    conn.commit()
-    conn.close()
 
+        # HTTP validators per RSS feed, for conditional requests
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT
+            )
+        """
+        )
 
-def insert_article(title, link, published, content, source):
-    """Insert new article if it doesn't exist."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+        # Digest of each scraping source's link list at its last complete scrape
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_digests (
+                url TEXT PRIMARY KEY,
+                digest TEXT NOT NULL
+            )
+        """
+        )
 
-    try:
+        # Only unsummarized articles are looked up by status, newest first
         cursor.execute(
             """
-            INSERT OR IGNORE INTO articles (title, link, published, content, source)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (title, link, published, content, source),
+            CREATE INDEX IF NOT EXISTS idx_articles_unsummarized
+            ON articles (published DESC) WHERE is_summarized = FALSE
+        """
+        )
+        # Latest summary per article; articles.link is already indexed by UNIQUE
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_summaries_article_generated
+            ON summaries (article_id, generated_at DESC)
+        """
+        )
+        # Covers the status flags, so the pipeline counts never read full rows
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_articles_status
+            ON articles (is_summarized, telegram_sent, audio_generated, linkedin_posted)
+        """
         )
 
-        article_id = cursor.lastrowid
         conn.commit()
-        return article_id if cursor.rowcount > 0 else None
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return None
-    finally:
-        conn.close()
+
+
+def insert_article(title, link, published, content, source):
+    """Insert new article if it doesn't exist."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            # RETURNING yields no row when the link already exists
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO articles (title, link, published, content, source)
+                VALUES (?, ?, ?, ?, ?)
+                RETURNING id
+            """,
+                (title, link, published, content, source),
+            )
+
+            row = cursor.fetchone()
+            conn.commit()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+
+
+def insert_articles(rows):
+    """Insert (title, link, published, content, source) rows in one transaction.
+
+    Rows whose link already exists are ignored. Returns the newly inserted
+    articles, in insertion order.
+    """
+    if not rows:
+        return []
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            # AUTOINCREMENT ids only grow, so new rows are those past the old maximum
+            cursor.execute("SELECT COALESCE(MAX(id), 0) FROM articles")
+            last_id = cursor.fetchone()[0]
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO articles (title, link, published, content, source)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            conn.commit()
+            cursor.execute("SELECT * FROM articles WHERE id > ? ORDER BY id", (last_id,))
+            return [dict(article) for article in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
 
 
 def get_unsummarized_articles():
     """Get articles that haven't been summarized yet."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(
-        "SELECT * FROM articles WHERE is_summarized = FALSE ORDER BY published DESC"
-    )
-    articles = cursor.fetchall()
-
-    conn.close()
-    return [dict(article) for article in articles]
+        cursor.execute(
+            "SELECT * FROM articles WHERE is_summarized = FALSE ORDER BY published DESC"
+        )
+        # Build the dicts straight from the cursor, without an intermediate row list
+        return [dict(article) for article in cursor]
 
 
 def get_summarized_articles(limit=None):
     """Get articles that have been summarized."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-        SELECT a.*, s.summary
-        FROM articles a
-        JOIN summaries s ON a.id = s.article_id
-        WHERE a.is_summarized = TRUE
-        ORDER BY a.processed_at DESC
-    """
-
-    if limit:
-        query += f" LIMIT {limit}"
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        query = """
+            SELECT a.*, s.summary
+            FROM articles a
+            JOIN summaries s ON a.id = s.article_id
+            WHERE a.is_summarized = TRUE
+            ORDER BY a.processed_at DESC
+        """
 
-    cursor.execute(query)
-    articles = cursor.fetchall()
+        if limit:
+            query += f" LIMIT {limit}"
 
-    conn.close()
-    return [dict(article) for article in articles]
+        cursor.execute(query)
+        return [dict(article) for article in cursor]
 
 
 def mark_article_summarized(article_id, summary, provider):
     """Mark article as summarized and store summary."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    try:
-        # Update article status
-        cursor.execute(
-            """
-            UPDATE articles
-            SET is_summarized = TRUE, processed_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """,
-            (article_id,),
-        )
-
-        # Insert summary
-        cursor.execute(
-            """
-            INSERT INTO summaries (article_id, summary, provider)
-            VALUES (?, ?, ?)
-        """,
-            (article_id, summary, provider),
-        )
-
-        conn.commit()
-        return True
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return False
-    finally:
-        conn.close()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            # Update article status
+            cursor.execute(
+                """
+                UPDATE articles
+                SET is_summarized = TRUE, processed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """,
+                (article_id,),
+            )
+
+            # Insert summary
+            cursor.execute(
+                """
+                INSERT INTO summaries (article_id, summary, provider)
+                VALUES (?, ?, ?)
+            """,
+                (article_id, summary, provider),
+            )
+
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
 
 
 def article_exists(link):
     """Check if article already exists by link."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("SELECT id FROM articles WHERE link = ?", (link,))
-    result = cursor.fetchone()
-
-    conn.close()
-    return result is not None
+        cursor.execute("SELECT id FROM articles WHERE link = ?", (link,))
+        result = cursor.fetchone()
+        return result is not None
 
 
 def log_processing_action(article_id, action):
     """Log processing action for article."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute(
-            """
-            INSERT INTO processing_log (article_id, action)
-            VALUES (?, ?)
-        """,
-            (article_id, action),
-        )
-        conn.commit()
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
-    finally:
-        conn.close()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                INSERT INTO processing_log (article_id, action)
+                VALUES (?, ?)
+            """,
+                (article_id, action),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
 
 
 def get_article_by_id(article_id):
     """Get article by ID."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-    article = cursor.fetchone()
-
-    conn.close()
-    return dict(article) if article else None
+        cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
+        article = cursor.fetchone()
+        return dict(article) if article else None
 
 
 def get_summary_by_article_id(article_id):
     """Get latest summary for article."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT * FROM summaries
-        WHERE article_id = ?
-        ORDER BY generated_at DESC
-        LIMIT 1
-    """,
-        (article_id,),
-    )
+        cursor.execute(
+            """
+            SELECT * FROM summaries
+            WHERE article_id = ?
+            ORDER BY generated_at DESC
+            LIMIT 1
+        """,
+            (article_id,),
+        )
 
-    summary = cursor.fetchone()
-    conn.close()
-    return dict(summary) if summary else None
+        summary = cursor.fetchone()
+        return dict(summary) if summary else None
+
+
+# One fixed statement per status column; SQLite's statement cache then reuses
+# the compiled statement, and no caller-supplied name is spliced into SQL
+_UPDATE_STATUS_SQL = {
+    field: f"UPDATE articles SET {field} = ? WHERE id = ?"
+    for field in (
+        "content_fetched",
+        "is_summarized",
+        "telegram_sent",
+        "audio_generated",
+        "linkedin_posted",
+    )
+}
 
 
 def update_article_status(article_id, status_field, value=True):
     """Update specific status field for article."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    sql = _UPDATE_STATUS_SQL.get(status_field)
+    if sql is None:
+        raise ValueError(f"Unknown article status field: {status_field}")
 
-    try:
-        cursor.execute(
-            f"UPDATE articles SET {status_field} = ? WHERE id = ?",
-            (value, article_id),
-        )
-        conn.commit()
-        return True
-    except sqlite3.Error as e:
-        print(f"Database error updating {status_field}: {e}")
-        return False
-    finally:
-        conn.close()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(sql, (value, article_id))
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error updating {status_field}: {e}")
+            return False
 
 
 def update_article_content(article_id, content):
     """Update article content and mark as content_fetched."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                "UPDATE articles SET content = ?, content_fetched = TRUE WHERE id = ?",
+                (content, article_id),
+            )
+            conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error updating content: {e}")
+            return False
+
+
+def get_all_article_urls():
+    """Get the set of all article URLs, to avoid duplicates."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+        # Plain tuples: a Row per link would only be unpacked again
+        cursor.row_factory = None
+
+        cursor.execute("SELECT link FROM articles")
+        return {url for (url,) in cursor}
+
+
+def get_existing_article_urls(urls):
+    """Get the subset of urls that are already stored, via the unique link index."""
+    urls = list(urls)
+    existing = set()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+
+        # Batched to stay well under SQLite's limit on bound parameters
+        for start in range(0, len(urls), 500):
+            batch = urls[start : start + 500]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT link FROM articles WHERE link IN ({placeholders})", batch
+            )
+            existing.update(url for (url,) in cursor)
+    return existing
+
+
+def get_feed_cache(url):
+    """Get the (etag, last_modified) stored for a feed, or (None, None)."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    try:
         cursor.execute(
-            "UPDATE articles SET content = ?, content_fetched = TRUE WHERE id = ?",
-            (content, article_id),
+            "SELECT etag, last_modified FROM feed_cache WHERE url = ?", (url,)
         )
-        conn.commit()
-        return True
-    except sqlite3.Error as e:
-        print(f"Database error updating content: {e}")
-        return False
-    finally:
-        conn.close()
+        row = cursor.fetchone()
+        return (row["etag"], row["last_modified"]) if row else (None, None)
 
 
-def get_all_article_urls():
-    """Get all article URLs to avoid duplicates."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+def set_feed_cache(url, etag, last_modified):
+    """Store the validators a feed was last served with."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO feed_cache (url, etag, last_modified)
+                VALUES (?, ?, ?)
+            """,
+                (url, etag, last_modified),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+
+
+def get_page_digest(url):
+    """Get the digest stored for a page, or None."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT digest FROM page_digests WHERE url = ?", (url,))
+        row = cursor.fetchone()
+        return row["digest"] if row else None
+
 
-    cursor.execute("SELECT link FROM articles")
-    urls = cursor.fetchall()
+def set_page_digest(url, digest):
+    """Store the digest of a page's current content."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    conn.close()
-    return [url[0] for url in urls]
+        try:
+            cursor.execute(
+                "INSERT OR REPLACE INTO page_digests (url, digest) VALUES (?, ?)",
+                (url, digest),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
 
 
 def get_article_by_url(url):
     """Get article by URL."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
 
-    cursor.execute("SELECT * FROM articles WHERE link = ?", (url,))
-    article = cursor.fetchone()
+        cursor.execute("SELECT * FROM articles WHERE link = ?", (url,))
+        article = cursor.fetchone()
+        return dict(article) if article else None
 
-    conn.close()
-    return dict(article) if article else None
+
+def get_processing_status_counts():
+    """Count articles at each stage of the processing pipeline."""
+    with _shared_connection() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT
+                COUNT(*) as total,
+                COUNT(*) FILTER (WHERE is_summarized = 0) as unsummarized,
+                COUNT(*) FILTER (WHERE is_summarized = 1 AND telegram_sent = 0) as summarized_not_sent,
+                COUNT(*) FILTER (WHERE telegram_sent = 1 AND audio_generated = 0) as sent_no_audio,
+                COUNT(*) FILTER (WHERE audio_generated = 1 AND linkedin_posted = 0) as audio_no_linkedin,
+                COUNT(*) FILTER (WHERE linkedin_posted = 1) as fully_processed
+            FROM articles
+        """
+        )
+        return dict(cursor.fetchone())
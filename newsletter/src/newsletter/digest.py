@@ -1,10 +1,11 @@
+import hashlib
 import json
 import os
-import time
 from langchain_core.prompts import PromptTemplate
 from tenacity import retry, stop_after_attempt, wait_fixed
-from common.llm import get_llm
+from common.llm import acquire_llm
 from common import config
+from .summaries import load_summaries
 
 # Rate limiting
 wait_time = 60 / config.RATE_LIMIT_RPM
@@ -16,17 +17,12 @@ wait_time = 60 / config.RATE_LIMIT_RPM
 )
 def generate_digest(summaries):
     """Generate a daily digest from article summaries."""
-    global last_llm_call
-    current_time = time.time()
-    time_since_last = config.last_llm_call
-    if time_since_last < wait_time:
-        time.sleep(wait_time - time_since_last)
-
-    llm = get_llm()
-
     if not summaries:
         return "No articles to summarize for this day."
 
+    # Paced by the same per-key rate limiters as every other LLM call
+    llm = acquire_llm()
+
     summaries_text = "\n\n".join(
         [f"- [{s['title']}]({s['link']}): {s['summary']}" for s in summaries]
     )
@@ -36,37 +32,68 @@ def generate_digest(summaries):
     )
     chain = prompt | llm
     response = chain.invoke({"summaries": summaries_text})
-    config.last_llm_call = time.time()
     return response.content.strip()
 
 
+def _summaries_key(summaries):
+    """Hash the summaries independently of their order in the file."""
+    ordered = sorted(summaries, key=lambda s: s["link"])
+    payload = json.dumps(ordered, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_digest(digest_file):
+    # Read digest text with encoding fallback
+    try:
+        with open(digest_file, "r", encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError:
+        # Fallback to Windows-1252 encoding for files with Windows-specific characters
+        with open(digest_file, "r", encoding="cp1252") as f:
+            return f.read()
+
+
 def create_daily_digest(date_str):
-    """Create and save daily digest for a date."""
+    """Create and save daily digest for a date.
+
+    The digest is regenerated only when summaries.json has changed since it
+    was written; digest.key records the hash of the summaries it was built from.
+    """
     date_dir = os.path.join(config.DATA_DIR, date_str)
     summaries_file = os.path.join(date_dir, "summaries.json")
     digest_file = os.path.join(date_dir, "digest.txt")
-
-    if os.path.exists(digest_file):
-        print(f"Digest already exists for {date_str}, skipping.")
-        # Read digest text with encoding fallback
-        try:
-            with open(digest_file, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Fallback to Windows-1252 encoding for files with Windows-specific characters
-            with open(digest_file, "r", encoding="cp1252") as f:
-                return f.read()
+    key_file = os.path.join(date_dir, "digest.key")
 
     if not os.path.exists(summaries_file):
+        if os.path.exists(digest_file):
+            print(f"Digest already exists for {date_str}, skipping.")
+            return _read_digest(digest_file)
         print(f"No summaries found for {date_str}")
         return None
 
-    with open(summaries_file, "r") as f:
-        summaries = json.load(f)
+    summaries = load_summaries(summaries_file)
+    key = _summaries_key(summaries)
+
+    if os.path.exists(digest_file):
+        try:
+            with open(key_file, "r") as f:
+                stored_key = f.read().strip()
+        except FileNotFoundError:
+            # Digest from before keys were recorded: adopt it for the current
+            # summaries, recording the key so later changes still invalidate it
+            with open(key_file, "w") as f:
+                f.write(key)
+            stored_key = key
+        if stored_key == key:
+            print(f"Digest already exists for {date_str}, skipping.")
+            return _read_digest(digest_file)
+        print(f"Summaries changed for {date_str}, regenerating digest.")
 
     digest = generate_digest(summaries)
 
     with open(digest_file, "w") as f:
         f.write(digest)
+    with open(key_file, "w") as f:
+        f.write(key)
 
     return digest
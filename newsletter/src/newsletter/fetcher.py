@@ -1,33 +1,123 @@
+import asyncio
 import feedparser
-import requests
+import httpx
 import certifi
-import time
-from datetime import datetime, timedelta
-from .config import SOURCES
-from .sources import RSS_SOURCES, SCRAPING_SOURCES
+import hashlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+from common.rate_limit import RateLimiter
+
+from .config import (
+    SOURCES,
+    FETCH_MAX_WORKERS,
+    MIN_ARTICLE_CHARS,
+    SCRAPE_MAX_WORKERS,
+    SCRAPE_PAGE_CONCURRENCY,
+    SCRAPE_REQUESTS_PER_SECOND,
+)
+from .sources import RSS_BY_NAME, RSS_SOURCES, SCRAPING_BY_NAME, SCRAPING_SOURCES
 from .scraper import GenericBlogScraper
-from .db import insert_article, article_exists, init_db
+from .db import (
+    get_existing_article_urls,
+    get_feed_cache,
+    get_page_digest,
+    get_processing_status_counts,
+    init_db,
+    insert_articles,
+    set_feed_cache,
+    set_page_digest,
+)
+
+_FEED_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0 Safari/537.36"
+    )
+}
 
+# Returned in place of a parsed feed when the server reports it unchanged
+UNCHANGED = object()
 
-def fetch_feed(url):
-    """Fetch and parse RSS feed with proper error handling."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        )
-    }
 
+# One limiter per host, shared by every source that scrapes it
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+
+def _rate_limit_for(url):
+    """Get the rate limiter for url's host."""
+    host = urlparse(url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = RateLimiter(1.0 / SCRAPE_REQUESTS_PER_SECOND)
+        return _host_limits[host]
+
+
+def _parse_feed(body):
+    """Parse a downloaded feed body."""
+    # Given bytes, feedparser first tries them as a file path (an open() of
+    # the whole body); a stream is read directly, and BytesIO shares the buffer
+    return feedparser.parse(io.BytesIO(body))
+
+
+async def fetch_feed_async(client, url):
+    """Fetch and parse an RSS feed over a shared client, or return None on error.
+
+    Returns UNCHANGED, without downloading or parsing the body, when the
+    feed has not changed since the validators stored on the last fetch.
+    The response's validators are returned in the feed's etag and modified
+    keys, as feedparser does for the URLs it fetches itself; the caller
+    stores them with set_feed_cache once the feed's entries are saved.
+    """
+    etag, last_modified = get_feed_cache(url)
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
     try:
-        response = requests.get(
-            url, headers=headers, verify=certifi.where(), timeout=10
-        )
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            return UNCHANGED
         response.raise_for_status()
-        return feedparser.parse(response.content)
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error fetching from {url}: {e}")
         return None
+    # Parsing is CPU-bound, so keep it off the event loop while other feeds download
+    loop = asyncio.get_running_loop()
+    feed = await loop.run_in_executor(None, _parse_feed, response.content)
+    feed["etag"] = response.headers.get("ETag")
+    feed["modified"] = response.headers.get("Last-Modified")
+    return feed
+
+
+async def fetch_feeds_async(urls):
+    """Fetch and parse several RSS feeds concurrently, in the order given.
+
+    One pooled client serves every feed, so connections to a host are
+    kept alive and reused rather than re-handshaken per feed.
+    """
+    limits = httpx.Limits(
+        max_connections=FETCH_MAX_WORKERS, max_keepalive_connections=FETCH_MAX_WORKERS
+    )
+    async with httpx.AsyncClient(
+        headers=_FEED_HEADERS,
+        verify=certifi.where(),
+        timeout=10.0,
+        limits=limits,
+        follow_redirects=True,
+    ) as client:
+        return await asyncio.gather(*(fetch_feed_async(client, url) for url in urls))
+
+
+def fetch_feed(url):
+    """Fetch and parse RSS feed with proper error handling."""
+    return asyncio.run(fetch_feeds_async([url]))[0]
 
 
 def fetch_new_articles(limit_website=None):
@@ -36,37 +126,20 @@ def fetch_new_articles(limit_website=None):
     new_articles = []
 
     # Fetch from last 14 days to get recent content
-    since_date = datetime.now() - timedelta(days=30)
-
-    # Get existing URLs to avoid duplicates
-    from .db import get_all_article_urls
-
-    seen_urls = set(get_all_article_urls())
+    # feedparser's *_parsed fields are UTC, so the cutoff is taken in UTC too
+    since_date = datetime.now(timezone.utc) - timedelta(days=30)
+    since_fields = since_date.timetuple()[:6]
 
     # Get processing status statistics
-    from .db import get_db_connection
-
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
-        """
-        SELECT
-            COUNT(*) as total,
-            SUM(CASE WHEN is_summarized = 0 THEN 1 ELSE 0 END) as unsummarized,
-            SUM(CASE WHEN is_summarized = 1 AND telegram_sent = 0 THEN 1 ELSE 0 END) as summarized_not_sent,
-            SUM(CASE WHEN telegram_sent = 1 AND audio_generated = 0 THEN 1 ELSE 0 END) as sent_no_audio,
-            SUM(CASE WHEN audio_generated = 1 AND linkedin_posted = 0 THEN 1 ELSE 0 END) as audio_no_linkedin,
-            SUM(CASE WHEN linkedin_posted = 1 THEN 1 ELSE 0 END) as fully_processed
-        FROM articles
-    """
-    )
-    status_counts = dict(cursor.fetchone())
-    conn.close()
+    status_counts = get_processing_status_counts()
+
+    # Links claimed by a scraping source during this run; stored links are
+    # looked up per source instead of loading every URL in the database
+    claimed_urls = set()
 
     # Statistics tracking
     stats = {
-        "existing_articles": len(seen_urls),
+        "existing_articles": status_counts["total"],
         "processing_status": status_counts,
         "rss": {
             "total_entries": 0,
@@ -88,153 +161,248 @@ def fetch_new_articles(limit_website=None):
     scraping_sources_to_use = SCRAPING_SOURCES
 
     if limit_website:
-        if limit_website in [s["name"] for s in SCRAPING_SOURCES]:
+        if limit_website in SCRAPING_BY_NAME:
             # Only scrape the specified website
-            scraping_sources_to_use = [
-                s for s in SCRAPING_SOURCES if s["name"] == limit_website
-            ]
+            scraping_sources_to_use = [SCRAPING_BY_NAME[limit_website]]
             rss_sources_to_use = []
-        elif limit_website in [s["name"] for s in RSS_SOURCES]:
-            # Only use RSS sources with matching name
-            rss_sources_to_use = [s for s in RSS_SOURCES if s["name"] == limit_website]
+        elif limit_website in RSS_BY_NAME:
+            # Only use the RSS source with matching name
+            rss_sources_to_use = [RSS_BY_NAME[limit_website]]
             scraping_sources_to_use = []
         else:
             print(f"Website '{limit_website}' not found in sources. Using all sources.")
 
-    # Fetch from RSS sources
-    for source in rss_sources_to_use:
+    # Scraping sources start first, on their own workers, so their page loads
+    # and polite delays overlap with the RSS fetch below instead of following it
+    claimed_lock = threading.Lock()
+    workers = max(1, min(SCRAPE_MAX_WORKERS, len(scraping_sources_to_use)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda config: _scrape_source(config, claimed_urls, claimed_lock),
+            scraping_sources_to_use,
+        )
+
+        new_articles.extend(
+            _fetch_rss_sources(rss_sources_to_use, since_fields, stats["rss"])
+        )
+
+        for source_stats, source_articles in results:
+            for key, value in source_stats.items():
+                stats["scraping"][key] += value
+            new_articles.extend(source_articles)
+
+    # Print statistics summary as one write, so it can't interleave with
+    # output from other threads
+    rss, scraping = stats["rss"], stats["scraping"]
+    print(
+        "\n".join(
+            [
+                "\n=== FETCHING STATISTICS ===",
+                f"Existing articles in DB: {stats['existing_articles']}",
+                "\nRSS Sources:",
+                f"  Total entries processed: {rss['total_entries']}",
+                f"  Filtered (too old): {rss['recent_filtered']}",
+                f"  Filtered (duplicates): {rss['duplicates']}",
+                f"  Filtered (insufficient content): {rss['length_filtered']}",
+                f"  Articles added: {rss['added']}",
+                "\nScraping Sources:",
+                f"  Total links found: {scraping['total_links']}",
+                f"  Filtered (duplicates): {scraping['duplicates']}",
+                f"  Filtered (insufficient content): {scraping['length_filtered']}",
+                f"  Articles added: {scraping['added']}",
+                f"\nTotal new articles added: {len(new_articles)}",
+                "=" * 30,
+            ]
+        )
+    )
+
+    return new_articles
+
+
+def _fetch_rss_sources(rss_sources, since_fields, stats):
+    """Fetch and store recent articles from RSS sources, returning the new ones."""
+    # Fetch all RSS feeds concurrently; the requests are network-bound and
+    # independent, so total time is the slowest feed rather than the sum
+    for source in rss_sources:
+        print(f"Fetching RSS from {source['name']}: {source['url']}")
+    feeds = asyncio.run(
+        fetch_feeds_async([source["url"] for source in rss_sources])
+    )
+
+    # Process RSS entries in source order, collecting rows so they are
+    # inserted together in a single transaction; the unique index on link
+    # skips articles that are already stored
+    rss_rows = []
+    fetched = []  # (source url, feed, links of its rows to store)
+    for source, feed in zip(rss_sources, feeds):
         source_url = source["url"]
-        print(f"Fetching RSS from {source['name']}: {source_url}")
-        feed = fetch_feed(source_url)
         if feed is None:
             continue  # Skip this source if fetch failed
+        if feed is UNCHANGED:
+            print(f"No changes in {source['name']} since the last fetch")
+            continue
+        feed_links = []
+        fetched.append((source_url, feed, feed_links))
 
         for entry in feed.entries:
-            stats["rss"]["total_entries"] += 1
-            published = None
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                published = datetime(*entry.updated_parsed[:6])
-            else:
+            stats["total_entries"] += 1
+            published_parsed = entry.get("published_parsed") or entry.get(
+                "updated_parsed"
+            )
+            if not published_parsed:
                 continue  # Skip if no date
 
-            # Only process recent articles
-            if published < since_date:
-                stats["rss"]["recent_filtered"] += 1
+            # Only process recent articles; compare the parsed fields directly
+            # so a datetime is only built for entries that pass the cutoff
+            if published_parsed[:6] < since_fields:
+                stats["recent_filtered"] += 1
                 continue
+            published = datetime(*published_parsed[:6])
 
-            # Check if article already exists
-            if article_exists(entry.link):
-                stats["rss"]["duplicates"] += 1
-                continue  # Skip existing articles
-
-            # Extract content from RSS
-            content = (
-                getattr(entry, "content", [{}])[0].get("value", "")
-                if hasattr(entry, "content")
-                else ""
-            )
+            # Extract content from RSS, reading the attribute once
+            content_list = getattr(entry, "content", None)
+            content = content_list[0].get("value", "") if content_list else ""
 
             # Skip articles with insufficient content
-            if len(content) < 1000:
-                stats["rss"]["length_filtered"] += 1
+            if len(content) < MIN_ARTICLE_CHARS:
+                stats["length_filtered"] += 1
                 continue
 
-            # Insert new article into database
-            article_id = insert_article(
-                title=entry.title,
-                link=entry.link,
-                published=published.isoformat(),
-                content=content,
-                source=source_url,
+            rss_rows.append(
+                (entry.title, entry.link, published.isoformat(), content, source_url)
             )
+            feed_links.append(entry.link)
+
+    # Insert all RSS articles at once; rows that were ignored are duplicates
+    new_articles = insert_articles(rss_rows)
+    for article_data in new_articles:
+        stats["added"] += 1
+        print(f"Added new article: {article_data['title']}")
+    stats["duplicates"] = len(rss_rows) - stats["added"]
+
+    # A feed's validators are stored only once all of its rows are, so a
+    # failed insert or a crash means a full fetch next run rather than a 304
+    stored_links = get_existing_article_urls(row[1] for row in rss_rows)
+    for source_url, feed, feed_links in fetched:
+        if (feed["etag"] or feed["modified"]) and all(
+            link in stored_links for link in feed_links
+        ):
+            set_feed_cache(source_url, feed["etag"], feed["modified"])
+    return new_articles
 
-            if article_id:
-                stats["rss"]["added"] += 1
-                print(f"Added new article: {entry.title}")
-                # Get the full article data from DB
-                from .db import get_article_by_id
-
-                article_data = get_article_by_id(article_id)
-                if article_data:
-                    new_articles.append(article_data)
-
-    # Fetch from scraping sources
-    for scraping_config in scraping_sources_to_use:
-        print(f"Scraping from {scraping_config['name']}: {scraping_config['base_url']}")
-        try:
-            scraper = GenericBlogScraper(
-                root_url=scraping_config["base_url"],
-                config=scraping_config.get("config"),
-                headless=True,
-            )
 
-            # Extract all blog links from the index page
-            all_links = scraper.extract_blog_links()
-            stats["scraping"]["total_links"] += len(all_links)
+def _scrape_source(scraping_config, claimed_urls, claimed_lock):
+    """Scrape one source, returning (stats, new articles).
 
-            for link in all_links:
-                if link in seen_urls:
-                    stats["scraping"]["duplicates"] += 1
-                    continue
+    claimed_urls is shared between workers and only touched under claimed_lock.
+    """
+    # Each worker thread runs its own event loop for the source's browser
+    return asyncio.run(_scrape_source_async(scraping_config, claimed_urls, claimed_lock))
 
-                # Check if article is already summarized before loading content
-                from .db import get_article_by_url
-                existing_article = get_article_by_url(link)
 
-                if existing_article and existing_article.get("is_summarized"):
-                    stats["scraping"]["duplicates"] += 1  # Count as duplicate since already summarized
-                    print(f"Skipping already summarized article: {link}")
-                    continue
+async def _scrape_source_async(scraping_config, claimed_urls, claimed_lock):
+    """Scrape one source with several article pages loading at once."""
+    stats = {"total_links": 0, "duplicates": 0, "length_filtered": 0, "added": 0}
+    pending_rows = []
+    links_digest = None
+    rejected_links = set()  # Links whose page is too short to hold an article
+
+    print(f"Scraping from {scraping_config['name']}: {scraping_config['base_url']}")
+    try:
+        # The scraper keeps one browser for all of this source's pages
+        async with GenericBlogScraper(
+            root_url=scraping_config["base_url"],
+            config=scraping_config.get("config"),
+            headless=True,
+        ) as scraper:
+            # Extract all blog links from the index page
+            all_links = await scraper.extract_blog_links()
+            stats["total_links"] += len(all_links)
+
+            # An unchanged link list means the last complete scrape already
+            # stored or rejected every article on it, so there is nothing to load
+            links_digest = hashlib.blake2b(
+                "\n".join(sorted(all_links)).encode(), digest_size=16
+            ).hexdigest()
+            if get_page_digest(scraping_config["base_url"]) == links_digest:
+                print(f"No changes in {scraping_config['name']} since the last scrape")
+                stats["duplicates"] += len(all_links)
+                return stats, []
+
+            # Skip links that are already stored (summarized or not) or that
+            # another source claimed during this run
+            stored_urls = get_existing_article_urls(all_links)
+            with claimed_lock:
+                new_links = [
+                    link
+                    for link in all_links
+                    if link not in stored_urls and link not in claimed_urls
+                ]
+                claimed_urls.update(new_links)
+            stats["duplicates"] += len(all_links) - len(new_links)
+
+            # Requests to the site, several at a time, but none starting
+            # faster than the host's polite rate
+            def polite(link):
+                return _rate_limit_for(link).wait_async()
+
+            # Pages that are too small to hold an article are skipped before
+            # the browser render; opt-in, as JS-built pages can be small shells
+            min_page_bytes = scraper.config["min_page_bytes"]
+            if min_page_bytes:
+                page_sizes = await scraper.peek_lengths(
+                    new_links, concurrency=SCRAPE_PAGE_CONCURRENCY, before_load=polite
+                )
+                links_to_load = []
+                for link, page_bytes in zip(new_links, page_sizes):
+                    if page_bytes is not None and page_bytes < min_page_bytes:
+                        stats["length_filtered"] += 1
+                        rejected_links.add(link)
+                    else:
+                        links_to_load.append(link)
+            else:
+                links_to_load = new_links
+
+            # Extract full article content
+            articles = await scraper.extract_articles(
+                links_to_load, concurrency=SCRAPE_PAGE_CONCURRENCY, before_load=polite
+            )
 
-                # Extract full article content
-                article_data = scraper.extract_article(link)
+            for article_data in articles:
+                if article_data is None:
+                    continue  # Page failed to load; already logged
 
                 # Skip articles with insufficient content
-                if len(article_data.get("content", "")) < 1000:
-                    stats["scraping"]["length_filtered"] += 1
+                if len(article_data.get("content", "")) < MIN_ARTICLE_CHARS:
+                    stats["length_filtered"] += 1
+                    rejected_links.add(article_data["url"])
                     continue
 
-                # Insert scraped article into database
-                article_id = insert_article(
-                    title=article_data["title"],
-                    link=article_data["url"],
-                    published="",  # Will be parsed later if needed
-                    content=article_data.get("content", ""),
-                    source=scraping_config["base_url"],
+                # Collect the row; the source's articles are inserted together below
+                pending_rows.append(
+                    (
+                        article_data["title"],
+                        article_data["url"],
+                        "",  # published: will be parsed later if needed
+                        article_data.get("content", ""),
+                        scraping_config["base_url"],
+                    )
                 )
 
-                if article_id:
-                    stats["scraping"]["added"] += 1
-                    # Get the full article data from DB
-                    from .db import get_article_by_id
+    except Exception as e:
+        print(f"Error scraping {scraping_config['name']}: {e}")
 
-                    db_article_data = get_article_by_id(article_id)
-                    if db_article_data:
-                        new_articles.append(db_article_data)
+    # Articles scraped before an error are still saved, in one transaction
+    new_articles = insert_articles(pending_rows)
+    stats["added"] = len(new_articles)
 
-                time.sleep(1.0)  # polite delay
+    # The listing may only be skipped next run once every link on it is
+    # stored or was rejected as too short. A page that failed to load, a
+    # failed insert, or a link another source claimed but hasn't stored yet
+    # leaves the digest unrecorded, so the listing is scraped again
+    if links_digest is not None:
+        expected_links = [link for link in all_links if link not in rejected_links]
+        if len(get_existing_article_urls(expected_links)) == len(expected_links):
+            set_page_digest(scraping_config["base_url"], links_digest)
 
-        except Exception as e:
-            print(f"Error scraping {scraping_config['name']}: {e}")
-            continue
-
-    # Print statistics summary
-    print("\n=== FETCHING STATISTICS ===")
-    print(f"Existing articles in DB: {stats['existing_articles']}")
-    print(f"\nRSS Sources:")
-    print(f"  Total entries processed: {stats['rss']['total_entries']}")
-    print(f"  Filtered (too old): {stats['rss']['recent_filtered']}")
-    print(f"  Filtered (duplicates): {stats['rss']['duplicates']}")
-    print(f"  Filtered (insufficient content): {stats['rss']['length_filtered']}")
-    print(f"  Articles added: {stats['rss']['added']}")
-    print(f"\nScraping Sources:")
-    print(f"  Total links found: {stats['scraping']['total_links']}")
-    print(f"  Filtered (duplicates): {stats['scraping']['duplicates']}")
-    print(f"  Filtered (insufficient content): {stats['scraping']['length_filtered']}")
-    print(f"  Articles added: {stats['scraping']['added']}")
-    print(f"\nTotal new articles added: {len(new_articles)}")
-    print("=" * 30)
-
-    return new_articles
+    return stats, new_articles
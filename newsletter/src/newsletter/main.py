@@ -3,32 +3,96 @@ import sys
 import os
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add src to path for direct execution
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from newsletter.fetcher import fetch_new_articles
-from newsletter.summarizer import process_article, generate_linkedin_post_for_summary
+from newsletter.summarizer import process_articles_batch, generate_linkedin_post_for_summary
 from .audio import generate_summary_audio
 from .telegram import send_summary_sync
+from common.config import LLM_MAX_WORKERS
 from common.telegram import send_linkedin_post_content_sync
-from .db import get_unsummarized_articles, log_processing_action, update_article_status
+from .db import (
+    get_summarized_articles,
+    get_unsummarized_articles,
+    log_processing_action,
+    update_article_status,
+)
+
+__all__ = ["cli", "cleanup_data_directory", "force_send_existing", "run_newsletter"]
 
 
 def cleanup_data_directory():
     """Clean up the data directory by removing all contents."""
     data_dir = "data"
     if os.path.exists(data_dir):
-        for filename in os.listdir(data_dir):
-            file_path = os.path.join(data_dir, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                logging.error(f"Failed to delete {file_path}. Reason: {e}")
+        # scandir entries carry their file type, so no extra stat per entry
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except Exception as e:
+                    logging.error(f"Failed to delete {entry.path}. Reason: {e}")
+
+
+def _generate_audio(article, summary_text, tts):
+    """Generate the summary audio for an article."""
+    try:
+        generate_summary_audio(article["id"], summary_text, tts)
+        update_article_status(article["id"], "audio_generated")
+        log_processing_action(article["id"], "audio_generated")
+        logging.info(f"Generated audio for: {article['title']}")
+    except Exception as e:
+        logging.error(f"Failed to generate audio for {article['title']}: {e}")
+
+
+def _generate_linkedin_post(article, summary_text, provider):
+    """Generate the LinkedIn post for a summary, or None if that fails."""
+    try:
+        return generate_linkedin_post_for_summary(
+            article["title"],
+            summary_text,
+            article["link"],
+            article.get("published", "")[:10],  # date string
+            provider,
+        )
+    except Exception as e:
+        logging.error(f"Failed to post LinkedIn for {article['title']}: {e}")
+        return None
+
+
+def _deliver_article(article, summary_text, audio_future, post_future, no_audio):
+    """Send an article's Telegram summary, then its LinkedIn post once generated."""
+    if audio_future is not None:
+        audio_future.result()
+
+    try:
+        send_summary_sync(article, summary_text, no_audio=no_audio)
+        update_article_status(article["id"], "telegram_sent")
+        log_processing_action(article["id"], "telegram_sent")
+        logging.info(f"Sent Telegram message for: {article['title']}")
+    except Exception as e:
+        logging.error(f"Failed to send Telegram for {article['title']}: {e}")
+
+    if post_future is None:
+        logging.info("Skipped LinkedIn posting.")
+        return
+    linkedin_post = post_future.result()
+    if linkedin_post is None:
+        return  # Generation failed; already logged
+    try:
+        send_linkedin_post_content_sync(article["title"], linkedin_post)
+        update_article_status(article["id"], "linkedin_posted")
+        log_processing_action(article["id"], "linkedin_posted")
+        logging.info(f"Posted to LinkedIn for: {article['title']}")
+    except Exception as e:
+        logging.error(f"Failed to post LinkedIn for {article['title']}: {e}")
 
 
 def run_newsletter(
@@ -38,7 +102,7 @@ def run_newsletter(
     no_linkedin=False,
     limit_website=None,
 ):
-    """Fetch new articles from RSS feeds and scraping sources, then process unsummarized articles sequentially."""
+    """Fetch new articles from RSS feeds and scraping sources, then process unsummarized articles concurrently."""
     logging.info("Starting newsletter processing...")
 
     # Fetch new articles from RSS feeds and scraping sources
@@ -49,8 +113,6 @@ def run_newsletter(
         logging.info(f"Fetched {new_articles_count} new articles from all sources.")
 
     # Get all unsummarized articles (including newly fetched ones)
-    from .db import get_unsummarized_articles
-
     articles_to_process = get_unsummarized_articles()
     logging.info(f"Found {len(articles_to_process)} unsummarized articles to process.")
 
@@ -58,68 +120,52 @@ def run_newsletter(
         logging.info("No articles to process. All caught up!")
         return
 
-    # Process each unsummarized article sequentially
-    processed_count = 0
-    for article in articles_to_process:
-        logging.info(
-            f"Processing article {processed_count + 1}/{len(articles_to_process)}: {article['title']}"
-        )
+    # Summarize first, several articles per LLM call (fetch content and
+    # classify/summarize), then deliver the summaries
+    results = process_articles_batch(articles_to_process, provider)
 
-        # Process article: fetch content and generate summary
-        result = process_article(article, provider)
-        if not result:
-            logging.error(f"Failed to process article: {article['title']}")
-            continue
-
-        # Extract summary data (result is now a dict with summary, categories, full_summary)
-        if isinstance(result, dict):
-            summary_text = result.get("full_summary", result.get("summary", ""))
-            categories = result.get("categories", [])
-        else:
-            # Backward compatibility for string returns
-            summary_text = result
-            categories = []
-
-        # Generate audio if not skipping
-        if not no_audio:
-            try:
-                generate_summary_audio(article["id"], summary_text, tts)
-                update_article_status(article["id"], "audio_generated")
-                log_processing_action(article["id"], "audio_generated")
-                logging.info(f"Generated audio for: {article['title']}")
-            except Exception as e:
-                logging.error(f"Failed to generate audio for {article['title']}: {e}")
-
-        # Send summary via Telegram
-        try:
-            send_summary_sync(article, summary_text, no_audio=no_audio)
-            update_article_status(article["id"], "telegram_sent")
-            log_processing_action(article["id"], "telegram_sent")
-            logging.info(f"Sent Telegram message for: {article['title']}")
-        except Exception as e:
-            logging.error(f"Failed to send Telegram for {article['title']}: {e}")
-
-        # Generate and send LinkedIn post if not skipping
-        if not no_linkedin:
-            try:
-                linkedin_post = generate_linkedin_post_for_summary(
-                    article["title"],
-                    summary_text,
-                    article["link"],
-                    article.get("published", "")[:10],  # date string
-                    provider,
+    # Audio and LinkedIn posts wait on remote services (TTS, the LLM), so
+    # they are generated for several articles at once; messages are still
+    # sent from this thread in article order, so Telegram shows them in order
+    total = len(articles_to_process)
+    processed_count = 0
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        pending = []
+        for article, result in zip(articles_to_process, results):
+            if not result:
+                pending.append((article, None, None, None))
+                continue
+            # Extract summary data (result is now a dict with summary, categories, full_summary)
+            if isinstance(result, dict):
+                summary_text = result.get("full_summary", result.get("summary", ""))
+            else:
+                # Backward compatibility for string returns
+                summary_text = result
+            audio_future = post_future = None
+            if not no_audio:
+                audio_future = executor.submit(_generate_audio, article, summary_text, tts)
+            if not no_linkedin:
+                post_future = executor.submit(
+                    _generate_linkedin_post, article, summary_text, provider
                 )
-                send_linkedin_post_content_sync(article["title"], linkedin_post)
-                update_article_status(article["id"], "linkedin_posted")
-                log_processing_action(article["id"], "linkedin_posted")
-                logging.info(f"Posted to LinkedIn for: {article['title']}")
-            except Exception as e:
-                logging.error(f"Failed to post LinkedIn for {article['title']}: {e}")
-        else:
-            logging.info("Skipped LinkedIn posting.")
-
-        processed_count += 1
-        logging.info(f"Completed processing article: {article['title']}")
+            pending.append((article, summary_text, audio_future, post_future))
+
+        for position, (article, summary_text, audio_future, post_future) in enumerate(
+            pending, start=1
+        ):
+            if summary_text is None:
+                logging.error(f"Failed to process article: {article['title']}")
+                continue
+            logging.info(f"Delivering article {position}/{total}: {article['title']}")
+            _deliver_article(
+                article,
+                summary_text,
+                audio_future=audio_future,
+                post_future=post_future,
+                no_audio=no_audio,
+            )
+            processed_count += 1
+            logging.info(f"Completed processing article: {article['title']}")
 
     logging.info(
         f"Newsletter processing completed. Processed {processed_count} articles."
@@ -130,8 +176,6 @@ def force_send_existing(limit=None, no_audio=False):
     """Force send all summarized articles to Telegram."""
     logging.info("Starting force send of existing summarized articles...")
 
-    from .db import get_summarized_articles
-
     articles_to_send = get_summarized_articles(limit=limit)
     logging.info(f"Found {len(articles_to_send)} summarized articles to send.")
 
@@ -175,7 +219,7 @@ def cli():
 @click.option(
     "--tts",
     default="gtts",
-    help="TTS model or provider to use (default: gtts, use 'microsoft/speecht5_tts' for local model)",
+    help="TTS model or provider to use (default: gtts, use 'piper' or 'microsoft/speecht5_tts' for local models)",
 )
 @click.option("--no-audio", is_flag=True, help="Skip audio generation")
 @click.option("--no-linkedin", is_flag=True, help="Skip LinkedIn posting")
@@ -1,9 +1,14 @@
+import asyncio
 import time
 import re
 import logging
 from urllib.parse import urljoin
+import httpx
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+import soupsieve
+from playwright.async_api import async_playwright
+
+from .config import MIN_ARTICLE_CHARS
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,86 +19,177 @@ DEFAULT_CONFIG = {
     "listing_selector": "a",               # Any anchor tag (override per site)
     "article_title_selector": "h1",        # Common title tag
     "article_body_selector": "article, .post-content, .blog-post",
+    "min_page_bytes": None,                # Skip smaller pages without rendering them
+    "requires_js": False,                  # Always render pages in the browser
 }
 
+_USER_AGENT = "Mozilla/5.0 (compatible; NewsletterBot/1.0)"
+
+# Resource types that never contribute to the extracted text
+_MEDIA_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+async def _skip_media(route):
+    """Abort requests for media resources and let everything else through."""
+    if route.request.resource_type in _MEDIA_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 
 class BlogScraper:
     def __init__(self, root_url, config=None, headless=True):
         self.root_url = root_url
         self.config = DEFAULT_CONFIG | (config or {})
         self.headless = headless
+        # All exclude patterns fused into one regex, so each link is scanned once
+        exclude_patterns = self.config.get("exclude_patterns", [])
+        self._exclude_re = (
+            re.compile("|".join(f"(?:{pattern})" for pattern in exclude_patterns))
+            if exclude_patterns
+            else None
+        )
+        # Prefixes as tuples, so each link is checked with a single startswith
+        self._exclude_prefixes = tuple(self.config.get("exclude_prefixes") or ())
+        self._url_prefixes = tuple(self.config.get("url_prefixes") or ())
+        # CSS selectors compiled once rather than on every page parsed
+        self._link_sel = soupsieve.compile(self.config["listing_selector"])
+        self._title_sel = soupsieve.compile(self.config["article_title_selector"])
+        self._body_sel = soupsieve.compile(self.config["article_body_selector"])
+        # One browser per scraper, launched lazily and shared by every page
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._launch_lock = asyncio.Lock()
+        # Plain HTTP client for pages that don't need JavaScript, created lazily
+        self._http = None
 
-    def _get_html(self, url):
-        """Loads dynamic JS content using Playwright."""
-        with sync_playwright() as p:
-            browser = p.firefox.launch(headless=self.headless)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (compatible; NewsletterBot/1.0)"
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_context(self):
+        """Launch the browser on first use and keep it for later pages."""
+        async with self._launch_lock:
+            if self._context is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.firefox.launch(
+                    headless=self.headless
+                )
+                self._context = await self._browser.new_context(
+                    user_agent=_USER_AGENT
+                )
+                # Only the text is scraped, so pages load without their media
+                await self._context.route("**/*", _skip_media)
+        return self._context
+
+    async def close(self):
+        """Shut down the browser and HTTP client, if they were started."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = self._context = None
+
+    def _client(self):
+        """The pooled HTTP client, created on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                headers={"User-Agent": _USER_AGENT},
+                follow_redirects=True,
+                timeout=30.0,
             )
-            page = context.new_page()
+        return self._http
+
+    async def _fetch_static(self, url):
+        """Get a page's server-rendered HTML over plain HTTP, or None on error."""
+        if self.config["requires_js"]:
+            return None
+        try:
+            logging.info(f"Fetching page: {url}")
+            response = await self._client().get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logging.info(f"Plain fetch of {url} failed, rendering instead: {e}")
+            return None
+        return response.text
 
+    async def _render(self, url):
+        """Loads dynamic JS content using Playwright."""
+        page = await (await self._get_context()).new_page()
+        try:
             logging.info(f"Loading page: {url}")
-            page.goto(url, timeout=120000)
-            page.wait_for_load_state("networkidle")
+            await page.goto(url, timeout=120000)
+            await page.wait_for_load_state("networkidle")
 
-            html = page.content()
-            browser.close()
-            return html
+            return await page.content()
+        finally:
+            await page.close()
 
-    def extract_blog_links(self):
+    async def extract_blog_links(self):
         """Extract article links from the root listing page."""
-        html = self._get_html(self.root_url)
-        soup = BeautifulSoup(html, "html.parser")
-        selector = self.config["listing_selector"]
+        # A plain fetch is enough for server-rendered listings; an empty
+        # result means the links are built by JavaScript, so render instead
+        links = None
+        html = await self._fetch_static(self.root_url)
+        if html is not None:
+            links = self._parse_links(html)
+        if not links:
+            links = self._parse_links(await self._render(self.root_url))
+
+        logging.info(f"Found {len(links)} article links")
+        return links
+
+    def _parse_links(self, html):
+        """Filter the article links out of a listing page."""
+        soup = BeautifulSoup(html, "lxml")
 
         links = set()
-        for tag in soup.select(selector):
+        for tag in self._link_sel.select(soup):
             href = tag.get("href")
             if not href:
                 continue
 
             # Skip non-article links
-            if href.startswith("#") or href.startswith("javascript:") or href.startswith("mailto:"):
+            if href.startswith(("#", "javascript:", "mailto:")):
                 continue
 
             # Convert relative → absolute URL properly
             href = urljoin(self.root_url, href)
 
             # First, check exclude prefixes (process exclusions first)
-            exclude_prefixes = self.config.get("exclude_prefixes", [])
             excluded = False
-            if exclude_prefixes:
-                for excl_prefix in exclude_prefixes:
-                    if href.startswith(excl_prefix):
-                        logging.info(f"Excluding URL (matches exclude prefix '{excl_prefix}'): {href}")
-                        excluded = True
-                        break
-            
+            if self._exclude_prefixes and href.startswith(self._exclude_prefixes):
+                excl_prefix = next(p for p in self._exclude_prefixes if href.startswith(p))
+                logging.info(f"Excluding URL (matches exclude prefix '{excl_prefix}'): {href}")
+                excluded = True
+
             # Check exclude patterns (regex)
-            if not excluded:
-                exclude_patterns = self.config.get("exclude_patterns", [])
-                if exclude_patterns:
-                    for pattern in exclude_patterns:
-                        if re.search(pattern, href):
-                            logging.info(f"Excluding URL (matches exclude pattern '{pattern}'): {href}")
-                            excluded = True
-                            break
+            if not excluded and self._exclude_re is not None:
+                if self._exclude_re.search(href):
+                    # Only on a hit: find which pattern matched, for the log
+                    pattern = next(
+                        p for p in self.config["exclude_patterns"] if re.search(p, href)
+                    )
+                    logging.info(f"Excluding URL (matches exclude pattern '{pattern}'): {href}")
+                    excluded = True
 
             if excluded:
                 continue  # Skip excluded links
 
             # Then filter links based on url_prefixes if provided, otherwise use old logic
-            url_prefixes = self.config.get("url_prefixes", [])
-            if url_prefixes:
+            if self._url_prefixes:
                 # Only include links that start with any of the allowed prefixes and are not the index page
-                included = False
-                for prefix in url_prefixes:
-                    if href.startswith(prefix) and href != self.root_url:
-                        links.add(href)
-                        included = True
-                        logging.info(f"Including URL (matches include prefix '{prefix}'): {href}")
-                        break
-                if not included and not excluded:
+                if href.startswith(self._url_prefixes) and href != self.root_url:
+                    links.add(href)
+                    prefix = next(p for p in self._url_prefixes if href.startswith(p))
+                    logging.info(f"Including URL (matches include prefix '{prefix}'): {href}")
+                else:
                     logging.debug(f"Skipping URL (doesn't match any include prefix): {href}")
             else:
                 # Fallback to old logic: contain blog/engineering and are not the index page
@@ -103,21 +199,52 @@ class BlogScraper:
                 elif not excluded:
                     logging.debug(f"Skipping URL (doesn't contain blog/engineering): {href}")
 
-        logging.info(f"Found {len(links)} article links")
         return list(links)
 
-    def extract_article(self, url):
+    async def peek_length(self, url):
+        """Size of the raw page in bytes, without rendering it, or None if unknown."""
+        # identity, so the size is not that of a compressed body
+        headers = {"Accept-Encoding": "identity"}
+        client = self._client()
+        try:
+            response = await client.head(url, headers=headers, timeout=10.0)
+            length = response.headers.get("Content-Length")
+            if response.is_success and length is not None:
+                return int(length)
+            # No length on HEAD: ask for one byte, the total is in Content-Range
+            async with client.stream(
+                "GET",
+                url,
+                headers=headers | {"Range": "bytes=0-0"},
+                timeout=10.0,
+            ) as response:
+                content_range = response.headers.get("Content-Range", "")
+                total = content_range.rpartition("/")[2]
+                return int(total) if response.status_code == 206 and total.isdigit() else None
+        except (httpx.HTTPError, ValueError) as e:
+            logging.debug(f"Could not peek at {url}: {e}")
+            return None
+
+    async def extract_article(self, url):
         """Get full article title + body."""
-        html = self._get_html(url)
-        soup = BeautifulSoup(html, "html.parser")
+        # Render when the plain page has too little body text to be kept, as
+        # server HTML may hold only a teaser or shell of a JS-built article
+        article = None
+        html = await self._fetch_static(url)
+        if html is not None:
+            article = self._parse_article(url, html)
+        if article is None or len(article["content"]) < MIN_ARTICLE_CHARS:
+            article = self._parse_article(url, await self._render(url))
+        return article
 
-        title_sel = self.config["article_title_selector"]
-        body_sel = self.config["article_body_selector"]
+    def _parse_article(self, url, html):
+        """Pull the title and body text out of an article page."""
+        soup = BeautifulSoup(html, "lxml")
 
-        title = soup.select_one(title_sel)
+        title = self._title_sel.select_one(soup)
         title = title.get_text(strip=True) if title else "Untitled"
 
-        body_tag = soup.select_one(body_sel)
+        body_tag = self._body_sel.select_one(soup)
         body = body_tag.get_text(separator="\n", strip=True) if body_tag else ""
 
         return {
@@ -127,6 +254,38 @@ class BlogScraper:
             "timestamp": int(time.time())
         }
 
+    async def peek_lengths(self, urls, concurrency=6, before_load=None):
+        """peek_length for several pages, paced like extract_articles."""
+        return await self._gather_limited(self.peek_length, urls, concurrency, before_load)
+
+    async def extract_articles(self, urls, concurrency=6, before_load=None):
+        """Extract several articles with up to `concurrency` pages loading at once.
+
+        Results are in the order of urls; a page that fails to load yields None.
+        before_load, if given, is awaited before each page load (e.g. a rate limit).
+        """
+
+        async def extract(url):
+            try:
+                return await self.extract_article(url)
+            except Exception as e:
+                logging.warning(f"Failed to extract {url}: {e}")
+                return None
+
+        return await self._gather_limited(extract, urls, concurrency, before_load)
+
+    async def _gather_limited(self, load, urls, concurrency, before_load):
+        """Await load(url) for each url, at most `concurrency` at a time, in order."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(url):
+            async with semaphore:
+                if before_load is not None:
+                    await before_load(url)
+                return await load(url)
+
+        return await asyncio.gather(*(run(url) for url in urls))
+
 
 # Legacy class name for backward compatibility
 GenericBlogScraper = BlogScraper
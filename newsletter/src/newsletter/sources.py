@@ -40,6 +40,7 @@ SCRAPING_SOURCES = [
         "name": "uber",
         "base_url": "https://www.uber.com/en-IN/blog/engineering/",
         "config": {
+            "requires_js": True,
             "article_body_selector": "div.bu.bv.j3.e5.e6.jk.ga",
             "url_prefixes": ["https://www.uber.com/en-IN/blog/"],
             "exclude_prefixes": [
@@ -245,3 +246,7 @@ SCRAPING_SOURCES = [
 ALL_SOURCES = [s["url"] for s in RSS_SOURCES] + [
     source["base_url"] for source in SCRAPING_SOURCES
 ]
+
+# Sources by name, for resolving a single website in O(1)
+RSS_BY_NAME = {s["name"]: s for s in RSS_SOURCES}
+SCRAPING_BY_NAME = {s["name"]: s for s in SCRAPING_SOURCES}
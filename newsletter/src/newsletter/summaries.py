@@ -0,0 +1,57 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+# Faster JSON parsing when available
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Anything but letters, digits, space, hyphen and underscore; \w is Unicode
+# aware like str.isalnum, so non-ASCII titles keep their letters
+_UNSAFE_TITLE_CHARS_RE = re.compile(r"[^\w \-]")
+
+
+def safe_title(title):
+    """Strip a title down to characters that are safe in a filename."""
+    return _UNSAFE_TITLE_CHARS_RE.sub("", title).rstrip()
+
+
+def read_json(path):
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def write_json(path, obj):
+    """Write obj as indented JSON, replacing the file atomically."""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+@lru_cache(maxsize=8)
+def _parse_summaries(path, mtime_ns, size):
+    """Parse a summaries file; the stat values key the cache to its current contents."""
+    return tuple(read_json(path))
+
+
+def load_summaries(summaries_file):
+    """Load a summaries.json file, parsing it again only when it has changed.
+
+    Steps that run back to back (audio, digest, LinkedIn post, Telegram) share
+    one parse. Returns a new list each time so callers can append to it.
+    """
+    stat = os.stat(summaries_file)
+    return list(_parse_summaries(summaries_file, stat.st_mtime_ns, stat.st_size))
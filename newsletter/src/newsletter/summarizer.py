@@ -1,10 +1,19 @@
 import os
-import json
+import shutil
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
-from common.llm import summarize_article, classify_and_summarize_article
-from common.config import DATA_DIR
+from common.llm import (
+    acquire_llm,
+    cached_invoke,
+    get_llm,
+    summarize_article,
+    classify_and_summarize_article,
+    classify_and_summarize_articles_batch,
+)
+from common.config import DATA_DIR, LLM_BATCH_SIZE, LLM_MAX_WORKERS
 from .db import mark_article_summarized, log_processing_action, update_article_content
+from .summaries import load_summaries, read_json, safe_title, write_json
 
 
 def fetch_article_content(url):
@@ -33,6 +42,11 @@ def fetch_article_content(url):
         return ""
 
 
+def _markdown_filename(title):
+    """Markdown filename for an article, derived from its title."""
+    return safe_title(title).replace(" ", "_").replace("-", "_") + ".md"
+
+
 def generate_markdown_article(article, date_str):
     """Generate markdown content for a single article."""
     title = article["title"]
@@ -55,11 +69,7 @@ def generate_markdown_article(article, date_str):
         content = fetch_article_content(link)
 
     # Create a safe filename from title
-    safe_title = "".join(
-        c for c in title if c.isalnum() or c in (" ", "-", "_")
-    ).rstrip()
-    safe_title = safe_title.replace(" ", "_").replace("-", "_")
-    filename = f"{safe_title}.md"
+    filename = _markdown_filename(title)
 
     markdown_content = f"""# {title}
 
@@ -94,11 +104,9 @@ def generate_markdown_articles_for_date(date_str):
         print(f"No articles or summaries found for {date_str}")
         return
 
-    with open(articles_file, "r") as f:
-        articles = json.load(f)
+    articles = read_json(articles_file)
 
-    with open(summaries_file, "r") as f:
-        summaries = json.load(f)
+    summaries = load_summaries(summaries_file)
 
     # Create a dict of summaries by link for quick lookup
     summaries_by_link = {s["link"]: s["summary"] for s in summaries}
@@ -133,27 +141,22 @@ def summarize_articles_for_date(date_str, provider="gemini"):
         print(f"No articles found for {date_str}")
         return []
 
-    with open(articles_file, "r") as f:
-        articles = json.load(f)
+    articles = read_json(articles_file)
 
     # Load existing summaries
     summaries = []
     if os.path.exists(summaries_file):
-        with open(summaries_file, "r") as f:
-            summaries = json.load(f)
+        summaries = load_summaries(summaries_file)
 
     # Create dict of existing summaries by link
     summaries_by_link = {s["link"]: s for s in summaries}
 
     os.makedirs(articles_dir, exist_ok=True)
     new_summaries = False
+    pending = []  # Articles without a generated markdown file yet
     for article in articles:
         # Check if markdown file already exists
-        safe_title = "".join(
-            c for c in article["title"] if c.isalnum() or c in (" ", "-", "_")
-        ).rstrip()
-        safe_title = safe_title.replace(" ", "_").replace("-", "_")
-        filename = f"{safe_title}.md"
+        filename = _markdown_filename(article["title"])
         filepath = os.path.join(articles_dir, filename)
         if os.path.exists(filepath):
             # Already generated, load summary if available
@@ -181,51 +184,66 @@ def summarize_articles_for_date(date_str, provider="gemini"):
                 except Exception:
                     pass  # Skip if can't extract
             continue
-        try:
-            print(f"Starting to summarize: {article['title']}")
-            result = classify_and_summarize_article(article, provider)
-
-            if result is None:
-                print(f"Article is not software engineering related, skipping: {article['title']}")
-                continue
-
-            # Extract summary and categories from result
-            summary = result.get("summary", "")
-            categories = result.get("categories", [])
-
-            print(f"Finished summarizing: {article['title']}")
-            if categories:
-                print(f"Categories: {', '.join(categories)}")
-
-            article_summary = {
-                "title": article["title"],
-                "link": article["link"],
-                "summary": summary,
-                "categories": categories,
-            }
-            summaries.append(article_summary)
-            summaries_by_link[article["link"]] = article_summary
-            new_summaries = True
-
-            # Save summaries immediately after generating summary
-            with open(summaries_file, "w") as f:
-                json.dump(summaries, f, indent=2)
+        pending.append(article)
+
+    # Classify and summarize several articles per LLM call, with batches in
+    # flight concurrently; map() hands back results in batch order so they
+    # are saved in the same order as before
+    batches = [
+        pending[start : start + LLM_BATCH_SIZE]
+        for start in range(0, len(pending), LLM_BATCH_SIZE)
+    ]
+    for article in pending:
+        print(f"Starting to summarize: {article['title']}")
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        batch_results = executor.map(
+            lambda batch: classify_and_summarize_articles_batch(batch, provider),
+            batches,
+        )
 
-            # Generate markdown immediately
-            article_with_summary = article.copy()
-            article_with_summary["summary"] = summary
-            if categories:
-                article_with_summary["summary"] += f"\n\n🏷️ Categories: {', '.join(categories)}"
-            filename, content = generate_markdown_article(
-                article_with_summary, date_str
-            )
-            filepath = os.path.join(articles_dir, filename)
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-            print(f"Summarized and generated markdown: {article['title']}")
-        except Exception as e:
-            print(f"Error summarizing {article['title']}: {e}")
-            raise  # Re-raise to stop processing
+        for batch, results in zip(batches, batch_results):
+            for article, result in zip(batch, results):
+                try:
+                    if result is None:
+                        print(f"Article is not software engineering related, skipping: {article['title']}")
+                        continue
+
+                    # Extract summary and categories from result
+                    summary = result.get("summary", "")
+                    categories = result.get("categories", [])
+
+                    print(f"Finished summarizing: {article['title']}")
+                    if categories:
+                        print(f"Categories: {', '.join(categories)}")
+
+                    article_summary = {
+                        "title": article["title"],
+                        "link": article["link"],
+                        "summary": summary,
+                        "categories": categories,
+                    }
+                    summaries.append(article_summary)
+                    summaries_by_link[article["link"]] = article_summary
+                    new_summaries = True
+
+                    # Save summaries immediately after generating summary
+                    write_json(summaries_file, summaries)
+
+                    # Generate markdown immediately
+                    article_with_summary = article.copy()
+                    article_with_summary["summary"] = summary
+                    if categories:
+                        article_with_summary["summary"] += f"\n\n🏷️ Categories: {', '.join(categories)}"
+                    filename, content = generate_markdown_article(
+                        article_with_summary, date_str
+                    )
+                    filepath = os.path.join(articles_dir, filename)
+                    with open(filepath, "w", encoding="utf-8") as f:
+                        f.write(content)
+                    print(f"Summarized and generated markdown: {article['title']}")
+                except Exception as e:
+                    print(f"Error summarizing {article['title']}: {e}")
+                    raise  # Re-raise to stop processing
 
     if new_summaries:
         print(f"Updated summaries for {date_str}")
@@ -245,19 +263,17 @@ def generate_combined_articles_markdown(date_str):
         return
 
     article_files = sorted([f for f in os.listdir(articles_dir) if f.endswith(".md")])
-    combined_content = ""
 
-    for article_file in article_files:
-        filepath = os.path.join(articles_dir, article_file)
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
-        combined_content += content + "\n\n"
-
-    # Save combined file
+    # Save combined file, copying each article straight into it rather than
+    # growing one string with every article
     combined_path = os.path.join(DATA_DIR, "articles", f"{date_str}.md")
     os.makedirs(os.path.dirname(combined_path), exist_ok=True)
-    with open(combined_path, "w", encoding="utf-8") as f:
-        f.write(combined_content)
+    with open(combined_path, "w", encoding="utf-8") as out:
+        for article_file in article_files:
+            filepath = os.path.join(articles_dir, article_file)
+            with open(filepath, "r", encoding="utf-8") as f:
+                shutil.copyfileobj(f, out)
+            out.write("\n\n")
     print(f"Generated combined articles markdown: {combined_path}")
 
 
@@ -275,19 +291,17 @@ def generate_linkedin_post_for_date(date_str, provider="gemini"):
         print(f"No summaries found for {date_str}")
         return
 
-    with open(summaries_file, "r") as f:
-        summaries = json.load(f)
+    summaries = load_summaries(summaries_file)
 
     if not summaries:
         print(f"No summaries to generate LinkedIn post for {date_str}")
         return
 
     # Combine summaries into one text
-    combined_summaries = ""
-    for summary in summaries:
-        combined_summaries += (
-            f"Title: {summary['title']}\nSummary: {summary['summary']}\n\n"
-        )
+    combined_summaries = "".join(
+        f"Title: {summary['title']}\nSummary: {summary['summary']}\n\n"
+        for summary in summaries
+    )
 
     # Prepare prompts
     system_prompt = """You are a technical writer creating LinkedIn posts about system design, architecture, and engineering insights.
@@ -373,30 +387,34 @@ Avoid lengthy introductions"""
 
     user_prompt = f"Title: {title}\nSummary: {summary}\nLink: {link}\n\nGenerate a concise, engaging LinkedIn post following the guidelines."
 
-    # Call LLM
-    llm = get_llm(provider)
-    from langchain_core.prompts import PromptTemplate
+    def generate():
+        # Call LLM, paced by the shared per-key rate limiters
+        llm = acquire_llm(provider)
+        from langchain_core.prompts import PromptTemplate
 
-    prompt = PromptTemplate.from_template(
-        "System Instructions: {system}\n\nUser: {user}\n\nLinkedIn Post:"
-    )
-    chain = prompt | llm
-    response = chain.invoke(
-        {
-            "system": system_prompt,
-            "user": user_prompt,
-        }
+        prompt = PromptTemplate.from_template(
+            "System Instructions: {system}\n\nUser: {user}\n\nLinkedIn Post:"
+        )
+        chain = prompt | llm
+        response = chain.invoke(
+            {
+                "system": system_prompt,
+                "user": user_prompt,
+            }
+        )
+        return response.content.strip()
+
+    # A summary that was already posted (a re-run after a partial failure, or
+    # a republished article) reuses its earlier post instead of a new LLM call
+    linkedin_post = cached_invoke(
+        provider, system_prompt, title, f"{summary}\n{link}", generate
     )
-    linkedin_post = response.content.strip()
 
     return linkedin_post
 
 
-def process_article(article, provider="gemini"):
-    """Process a single article: fetch content, summarize, and return summary."""
-    print(f"Processing article: {article['title']}")
-
-    # Fetch full content if RSS content is insufficient
+def _prepare_article(article):
+    """Fetch full content if RSS content is insufficient; return the LLM input."""
     content = article.get("content", "")
     if not content or len(content) < 200:
         print(f"Fetching full content from URL: {article['link']}")
@@ -407,7 +425,7 @@ def process_article(article, provider="gemini"):
             log_processing_action(article["id"], "content_fetched")
 
     # Prepare article data for summarization
-    article_for_summary = {
+    return {
         "title": article["title"],
         "link": article["link"],
         "content": content,  # Pass content in the content field as expected by LLM
@@ -415,48 +433,104 @@ def process_article(article, provider="gemini"):
         "source": article.get("source", ""),
     }
 
+
+def _store_summary(article, result, provider):
+    """Record a classify-and-summarize result; returns what process_article does."""
+    if result is None:
+        print(f"Article is not software engineering related, skipping: {article['title']}")
+        log_processing_action(article["id"], "skipped_non_tech")
+        return None
+
+    # Extract summary and categories from result
+    summary = result.get("summary", "")
+    categories = result.get("categories", [])
+
+    print(f"Summary generated for: {article['title']}")
+    if categories:
+        print(f"Categories: {', '.join(categories)}")
+
+    # Store both summary and categories in the database
+    # For now, we'll store categories as a JSON string in the summary field
+    # or extend the database schema. For backward compatibility, let's append categories to summary.
+    full_summary = summary
+    if categories:
+        categories_str = f"\n\n🏷️ Categories: {', '.join(categories)}"
+        full_summary += categories_str
+
+    # Mark article as summarized in DB
+    success = mark_article_summarized(article["id"], full_summary, provider)
+    if success:
+        log_processing_action(article["id"], "summarized")
+        print(f"Article processed and stored: {article['title']}")
+        # Return both summary and categories for further processing
+        return {
+            "summary": summary,
+            "categories": categories,
+            "full_summary": full_summary
+        }
+    else:
+        print(f"Failed to update database for: {article['title']}")
+        return None
+
+
+def process_article(article, provider="gemini"):
+    """Process a single article: fetch content, summarize, and return summary."""
+    print(f"Processing article: {article['title']}")
+    article_for_summary = _prepare_article(article)
+
     try:
         # Classify and summarize in one LLM call
         print(f"Processing and classifying: {article['title']}")
         result = classify_and_summarize_article(article_for_summary, provider)
-
-        if result is None:
-            print(f"Article is not software engineering related, skipping: {article['title']}")
-            log_processing_action(article["id"], "skipped_non_tech")
-            return None
-
-        # Extract summary and categories from result
-        summary = result.get("summary", "")
-        categories = result.get("categories", [])
-
-        print(f"Summary generated for: {article['title']}")
-        if categories:
-            print(f"Categories: {', '.join(categories)}")
-
-        # Store both summary and categories in the database
-        # For now, we'll store categories as a JSON string in the summary field
-        # or extend the database schema. For backward compatibility, let's append categories to summary.
-        full_summary = summary
-        if categories:
-            categories_str = f"\n\n🏷️ Categories: {', '.join(categories)}"
-            full_summary += categories_str
-
-        # Mark article as summarized in DB
-        success = mark_article_summarized(article["id"], full_summary, provider)
-        if success:
-            log_processing_action(article["id"], "summarized")
-            print(f"Article processed and stored: {article['title']}")
-            # Return both summary and categories for further processing
-            return {
-                "summary": summary,
-                "categories": categories,
-                "full_summary": full_summary
-            }
-        else:
-            print(f"Failed to update database for: {article['title']}")
-            return None
+        return _store_summary(article, result, provider)
 
     except Exception as e:
         print(f"Error processing article {article['title']}: {e}")
         log_processing_action(article["id"], f"error: {str(e)}")
         return None
+
+
+def process_articles_batch(articles, provider="gemini"):
+    """Process several articles like process_article, returning results in order.
+
+    Several articles are classified and summarized per LLM call, with batches
+    in flight concurrently, instead of one request per article.
+    """
+    prepared = []
+    for article in articles:
+        print(f"Processing article: {article['title']}")
+        prepared.append(_prepare_article(article))
+
+    batches = [
+        range(start, min(start + LLM_BATCH_SIZE, len(articles)))
+        for start in range(0, len(articles), LLM_BATCH_SIZE)
+    ]
+
+    def process_batch(indices):
+        batch = [articles[i] for i in indices]
+        try:
+            results = classify_and_summarize_articles_batch(
+                [prepared[i] for i in indices], provider
+            )
+        except Exception as e:
+            for article in batch:
+                print(f"Error processing article {article['title']}: {e}")
+                log_processing_action(article["id"], f"error: {str(e)}")
+            return [None] * len(batch)
+
+        stored = []
+        for article, result in zip(batch, results):
+            try:
+                stored.append(_store_summary(article, result, provider))
+            except Exception as e:
+                print(f"Error processing article {article['title']}: {e}")
+                log_processing_action(article["id"], f"error: {str(e)}")
+                stored.append(None)
+        return stored
+
+    with ThreadPoolExecutor(max_workers=LLM_MAX_WORKERS) as executor:
+        return [
+            result
+            for batch_results in executor.map(process_batch, batches)
+            for result in batch_results
+        ]
@@ -1,10 +1,10 @@
 import os
 import asyncio
-import json
 from telegram import Bot
 from telegram.error import TelegramError
 from .config import get_telegram_bot_token, get_telegram_chat_id
 from common.config import DATA_DIR
+from .summaries import load_summaries
 
 
 async def _send_message_with_fallback(bot, chat_id, text, parse_mode):
@@ -30,27 +30,32 @@ async def _send_message_with_fallback(bot, chat_id, text, parse_mode):
 async def _send_text_in_chunks(bot, chat_id, text, max_length):
     """Split text into chunks and send each chunk, preferring paragraph breaks."""
     paragraphs = text.split("\n\n")
-    current_chunk = ""
+    # Paragraphs of the current chunk and its joined length
+    current_chunk = []
+    current_length = 0
 
     for paragraph in paragraphs:
         # If adding this paragraph would exceed the limit, send current chunk
-        if len(current_chunk) + len(paragraph) + 2 > max_length:  # +2 for \n\n
-            if current_chunk:
+        if current_length + len(paragraph) + 2 > max_length:  # +2 for \n\n
+            if current_length:
                 await _send_message_with_fallback(
-                    bot, chat_id, current_chunk.strip(), "Markdown"
+                    bot, chat_id, "\n\n".join(current_chunk).strip(), "Markdown"
                 )
-                current_chunk = ""
+                current_chunk = []
+                current_length = 0
 
         # Add paragraph to current chunk
-        if current_chunk:
-            current_chunk += "\n\n" + paragraph
+        if current_length:
+            current_chunk.append(paragraph)
+            current_length += 2 + len(paragraph)
         else:
-            current_chunk = paragraph
+            current_chunk = [paragraph]
+            current_length = len(paragraph)
 
     # Send remaining chunk
-    if current_chunk:
+    if current_length:
         await _send_message_with_fallback(
-            bot, chat_id, current_chunk.strip(), "Markdown"
+            bot, chat_id, "\n\n".join(current_chunk).strip(), "Markdown"
         )
 
 
@@ -159,8 +164,7 @@ async def send_articles_via_telegram(date_str):
             print(f"No summaries file found for {date_str}")
             return
 
-        with open(summaries_file, "r") as f:
-            summaries = json.load(f)
+        summaries = load_summaries(summaries_file)
 
         if not summaries:
             print(f"No summaries to send for {date_str}")
@@ -0,0 +1,101 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add the parent directories to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "common" / "src"))
+
+from newsletter import db
+
+
+@pytest.fixture(autouse=True)
+def tmp_db(tmp_path, monkeypatch):
+    """Point the shared connection at a fresh database for each test."""
+    monkeypatch.setattr(db, "DB_PATH", str(tmp_path / "newsletter.db"))
+    monkeypatch.setattr(db, "_conn", None)
+    db.init_db()
+    yield
+    if db._conn is not None:
+        db._conn.close()
+
+
+def _row(n, source="Example"):
+    return (f"Post {n}", f"https://example.com/{n}", "2026-10-01", f"Body {n}", source)
+
+
+class TestDatabase:
+    """Test cases for the newsletter database helpers"""
+
+    def test_insert_articles_returns_new_rows(self):
+        """Test that insert_articles returns the inserted rows in order"""
+        articles = db.insert_articles([_row(1), _row(2)])
+
+        assert [a["link"] for a in articles] == [
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+        assert articles[0]["title"] == "Post 1"
+        assert articles[1]["content"] == "Body 2"
+        assert all(a["id"] for a in articles)
+
+    def test_insert_articles_ignores_duplicate_links(self):
+        """Test that rows whose link is already stored are skipped"""
+        first = db.insert_articles([_row(1)])
+        articles = db.insert_articles([_row(1, source="Other"), _row(2), _row(2)])
+
+        assert [a["link"] for a in articles] == ["https://example.com/2"]
+        assert db.get_article_by_id(first[0]["id"])["source"] == "Example"
+        assert db.get_processing_status_counts()["total"] == 2
+
+    def test_insert_articles_empty(self):
+        """Test that inserting no rows returns an empty list"""
+        assert db.insert_articles([]) == []
+
+    def test_get_existing_article_urls(self):
+        """Test that only stored links are returned, across query batches"""
+        db.insert_articles([_row(1), _row(700)])
+        urls = [f"https://example.com/{n}" for n in range(1000)]
+
+        assert db.get_existing_article_urls(urls) == {
+            "https://example.com/1",
+            "https://example.com/700",
+        }
+        assert db.get_existing_article_urls([]) == set()
+
+    def test_feed_cache_round_trip(self):
+        """Test that feed validators are stored, replaced and missing as None"""
+        url = "https://example.com/feed.xml"
+        assert db.get_feed_cache(url) == (None, None)
+
+        db.set_feed_cache(url, '"abc"', "Mon, 12 Oct 2026 10:00:00 GMT")
+        assert db.get_feed_cache(url) == ('"abc"', "Mon, 12 Oct 2026 10:00:00 GMT")
+
+        db.set_feed_cache(url, None, "Tue, 13 Oct 2026 10:00:00 GMT")
+        assert db.get_feed_cache(url) == (None, "Tue, 13 Oct 2026 10:00:00 GMT")
+
+    def test_page_digest_round_trip(self):
+        """Test that page digests are stored, replaced and missing as None"""
+        url = "https://example.com/blog"
+        assert db.get_page_digest(url) is None
+
+        db.set_page_digest(url, "digest-1")
+        assert db.get_page_digest(url) == "digest-1"
+
+        db.set_page_digest(url, "digest-2")
+        assert db.get_page_digest(url) == "digest-2"
+
+    def test_update_article_status(self):
+        """Test that a known status field is updated"""
+        article_id = db.insert_articles([_row(1)])[0]["id"]
+
+        assert db.update_article_status(article_id, "telegram_sent") is True
+        assert db.get_article_by_id(article_id)["telegram_sent"] == 1
+
+    def test_update_article_status_rejects_unknown_field(self):
+        """Test that an unknown status field raises instead of reaching SQL"""
+        article_id = db.insert_articles([_row(1)])[0]["id"]
+
+        with pytest.raises(ValueError):
+            db.update_article_status(article_id, "title = 'x', telegram_sent")
+        assert db.get_article_by_id(article_id)["title"] == "Post 1"
@@ -3,7 +3,6 @@ CLI for Text-to-Audio Converter using Hugging Face TTS.
 """
 
 import typer
-import os
 import pathlib
 import re
 from bs4 import BeautifulSoup
@@ -11,7 +10,8 @@ import torch
 from transformers import pipeline
 import numpy as np
 import soundfile as sf
-from pydub import AudioSegment
+
+from common.audio import write_samples_mp3
 
 
 def convert(
@@ -87,7 +87,8 @@ def convert(
             continue
         try:
             result = pipe(chunk)
-            audio_arrays.append(np.array(result["audio"]))
+            # Flatten (1, samples) outputs so chunks of any length concatenate
+            audio_arrays.append(np.asarray(result["audio"], dtype=np.float32).ravel())
             sample_rates.append(result["sampling_rate"])
         except Exception as e:
             typer.echo(f"Error generating audio for chunk: {e}")
@@ -128,11 +129,8 @@ def convert(
             ]
             target_rate = sample_rate
 
-    # Concatenate
-    concatenated = np.concatenate(audio_arrays)
-
-    # Audio array is (1, samples), squeeze to (samples,)
-    audio_data = concatenated.squeeze()
+    # Concatenate all samples in a single copy
+    audio_data = np.concatenate(audio_arrays)
 
     # Write file
     ext = pathlib.Path(output).suffix.lower()
@@ -140,13 +138,8 @@ def convert(
         sf.write(output, audio_data, target_rate)
         typer.echo(f"Audio saved to {output}")
     elif ext == ".mp3":
-        # Convert to mp3 using pydub
-        # First write temp wav
-        temp_wav = output.replace(".mp3", "_temp.wav")
-        sf.write(temp_wav, audio_data, target_rate)
-        audio = AudioSegment.from_wav(temp_wav)
-        audio.export(output, format="mp3")
-        os.remove(temp_wav)
+        # Encode the samples directly, without a temp WAV and pydub round trip
+        write_samples_mp3(output, audio_data, target_rate)
         typer.echo(f"Audio saved to {output}")
     else:
         sf.write(output.replace(ext, ".wav"), audio_data, target_rate)
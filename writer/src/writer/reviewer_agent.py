@@ -6,9 +6,20 @@ Reviews drafts and provides structured feedback with scores and patch operations
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
+import re
 
 from common.llm import get_llm
 
+# Question normalization, compiled once rather than on every comparison
+_PUNCTUATION_RE = re.compile(r"[^\w\s/]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_question(question: str) -> str:
+    """Lowercase, remove punctuation except slashes, and normalize whitespace."""
+    question = _PUNCTUATION_RE.sub("", question.lower())
+    return _WHITESPACE_RE.sub(" ", question).strip()
+
 
 class ReviewerAgent:
     """Agent responsible for reviewing and scoring drafts."""
@@ -180,19 +191,8 @@ RULES:
         Uses simple heuristics: exact match, normalized match (lowercase, remove punctuation),
         or if one is contained within the other (for longer/shorter versions).
         """
-        import re
-
-        # Normalize questions: lowercase, remove punctuation except slashes, normalize whitespace
-        def normalize(q):
-            q = q.lower()
-            q = re.sub(
-                r"[^\w\s/]", "", q
-            )  # Remove punctuation but keep word chars, spaces, slashes
-            q = re.sub(r"\s+", " ", q)  # Normalize whitespace
-            return q.strip()
-
-        q1_norm = normalize(question1)
-        q2_norm = normalize(question2)
+        q1_norm = _normalize_question(question1)
+        q2_norm = _normalize_question(question2)
 
         # Exact match
         if q1_norm == q2_norm: